@@ -1,68 +1,135 @@
 import json
-import numpy as np
-from visualizer import GeneralizedVisualizer, PlotConfig, setup_backend
-from views import PowerSeriesVisualizer, ODEResultsVisualizer
-from ui import SliderConfig
+
+
+def encode_key(params):
+    """Render a (neurons, hidden_layers, adam_iterations) tuple as a data key.
+
+    Keys are kept as tuples while generating data and only turned into the
+    "n{neurons}_h{hidden_layers}_a{adam_iterations}" strings expected by
+    PowerSeriesVisualizer at the serialization boundary.
+    """
+    neurons, hidden_layers, adam_iters = params
+    return f"n{neurons}_h{hidden_layers}_a{adam_iters}"
+
+
+# Amplitude, decay-rate factor and noise scale of the synthetic
+# total/bc/pde/supervised loss terms
+LOSS_AMPLITUDE = (1.0, 0.3, 0.5, 0.2)
+LOSS_DECAY_FACTOR = (1.0, 0.75, 1.25, 0.9)
+LOSS_NOISE_SCALE = (0.01, 0.005, 0.005, 0.003)
+
+
+def generate_loss_curves(decay_rates, noise, out=None, iterations=None):
+    """Synthesize noisy, exponentially decaying loss curves.
+
+    Parameters:
+    -----------
+    decay_rates : ndarray
+        Decay rate per parameter combination, shape (n,)
+    noise : ndarray
+        Standard normal noise, shape (n, 4, num_iterations)
+    out : ndarray, optional
+        Preallocated output buffer with the same shape as noise
+    iterations : ndarray, optional
+        Iteration numbers, shape (num_iterations,). Defaults to
+        0 .. num_iterations - 1
+
+    Returns:
+    --------
+    ndarray
+        Loss values clipped to >= 1e-6, shape (n, 4, num_iterations),
+        with the four terms ordered total, bc, pde, supervised
+    """
+    import numpy as np
+
+    if out is None:
+        out = np.empty_like(noise)
+
+    if iterations is None:
+        iterations = np.arange(noise.shape[-1])
+    neg_iters = -np.asarray(iterations, dtype=np.float64)
+
+    # exp(-t / decay) as one broadcast multiply by the reciprocal decay,
+    # written straight into the output buffer
+    inv_decay = 1.0 / (
+        decay_rates[:, None, None] * np.array(LOSS_DECAY_FACTOR)[None, :, None]
+    )
+    np.multiply(neg_iters, inv_decay, out=out)
+    np.exp(out, out=out)
+    out *= np.array(LOSS_AMPLITUDE)[None, :, None]
+    out += np.array(LOSS_NOISE_SCALE)[None, :, None] * noise
+    np.clip(out, 1e-6, None, out=out)
+    return out
 
 
 # Example with multi-parameter sliders (neurons, hidden layers, adam iterations)
 def example_with_loss():
     """Usage including loss data from training with multiple slider parameters."""
+    # Imported here so importing main does not pull in numpy/matplotlib
+    import numpy as np
+    from views import PowerSeriesVisualizer
+
+    # Parameter combinations as (neurons, hidden_layers, adam_iterations) tuples
+    combos = [
+        (neurons, hidden_layers, adam_iters)
+        for neurons in [10, 20, 30, 40, 50]
+        for hidden_layers in [1, 2, 3]
+        for adam_iters in [10000, 20000, 30000]
+    ]
 
     # Create example predicted coefficients JSON with multi-parameter keys
-    # Format: "n{neurons}_h{hidden_layers}_a{adam_iterations}"
     example_data = {}
 
     # Generate data for various combinations
-    for neurons in [10, 20, 30, 40, 50]:
-        for hidden_layers in [1, 2, 3]:
-            for adam_iters in [10000, 20000, 30000]:
-                key = f"n{neurons}_h{hidden_layers}_a{adam_iters}"
-                # Coefficients improve with more neurons and iterations
-                noise_factor = 1.0 - (neurons / 100) - (adam_iters / 100000)
-                example_data[key] = [
-                    1.0,
-                    2.0 + 0.1 * noise_factor,
-                    1.0 - 0.1 * noise_factor,
-                    1.0/6.0 + 0.02 * noise_factor,
-                    1.0/60.0 + 0.005 * noise_factor
-                ]
+    for neurons, hidden_layers, adam_iters in combos:
+        # Coefficients improve with more neurons and iterations
+        noise_factor = 1.0 - (neurons / 100) - (adam_iters / 100000)
+        example_data[(neurons, hidden_layers, adam_iters)] = [
+            1.0,
+            2.0 + 0.1 * noise_factor,
+            1.0 - 0.1 * noise_factor,
+            1.0/6.0 + 0.02 * noise_factor,
+            1.0/60.0 + 0.005 * noise_factor
+        ]
 
     with open('example_coefficients.json', 'w') as f:
-        json.dump(example_data, f, indent=2)
+        f.write(json.dumps({encode_key(k): v for k, v in example_data.items()}))
 
     # True coefficients
     true_coeffs = [1.0, 2.0, 1.0, 1.0/6.0, 1.0/60.0]
 
     # Create example loss data for each parameter combination
+    # All curves are generated at once: one row per (neurons, hidden, adam) combination
+    params = np.array(combos)
+    num_combos = len(params)
+    num_iterations = 1000
+    iterations = np.arange(num_iterations)
+
+    # Noise for all four loss terms of every combination in one bulk draw
+    rng = np.random.default_rng(0)
+    noise = rng.standard_normal((num_combos, 4, num_iterations))
+
+    # Simulate decreasing loss (better with more neurons/layers)
+    decay_rates = 200 + params[:, 0] * 2 + params[:, 1] * 50
+    losses = generate_loss_curves(decay_rates, noise, iterations=iterations)
+
+    # Rows are handed to the visualizer as ndarray views; the iteration axis
+    # is identical for every key, so all entries share the same array
     loss_data = {}
-    for neurons in [10, 20, 30, 40, 50]:
-        for hidden_layers in [1, 2, 3]:
-            for adam_iters in [10000, 20000, 30000]:
-                key = f"n{neurons}_h{hidden_layers}_a{adam_iters}"
-                num_iterations = 1000
-                iterations = np.arange(num_iterations)
-
-                # Simulate decreasing loss (better with more neurons/layers)
-                decay_rate = 200 + neurons * 2 + hidden_layers * 50
-                total_loss = 1.0 * np.exp(-iterations / decay_rate) + 0.01 * np.random.randn(num_iterations)
-                bc_loss = 0.3 * np.exp(-iterations / (decay_rate * 0.75)) + 0.005 * np.random.randn(num_iterations)
-                pde_loss = 0.5 * np.exp(-iterations / (decay_rate * 1.25)) + 0.005 * np.random.randn(num_iterations)
-                supervised_loss = 0.2 * np.exp(-iterations / (decay_rate * 0.9)) + 0.003 * np.random.randn(num_iterations)
-
-                loss_data[key] = {
-                    'iterations': iterations.tolist(),
-                    'total_loss': np.maximum(total_loss, 1e-6).tolist(),
-                    'bc_loss': np.maximum(bc_loss, 1e-6).tolist(),
-                    'pde_loss': np.maximum(pde_loss, 1e-6).tolist(),
-                    'supervised_loss': np.maximum(supervised_loss, 1e-6).tolist()
-                }
+    for idx, combo in enumerate(combos):
+        loss_data[combo] = {
+            'iterations': iterations,
+            'total_loss': losses[idx, 0],
+            'bc_loss': losses[idx, 1],
+            'pde_loss': losses[idx, 2],
+            'supervised_loss': losses[idx, 3]
+        }
 
     # Create visualizer with loss data
     visualizer = PowerSeriesVisualizer(
         json_file_path='example_coefficients.json',
         true_coefficients=true_coeffs,
-        loss_data=loss_data,
+        loss_data={encode_key(k): v for k, v in loss_data.items()},
         x_range=(0, 1),
         num_points=1000,
         neuron_range=(10, 50),
@@ -74,6 +141,8 @@ def example_with_loss():
 
 def example_with_real_ode_data():
     """Visualize real PINN training results for an ODE problem."""
+    from views import ODEResultsVisualizer
+
     visualizer = ODEResultsVisualizer(
         results_json_path="results/results.json",
         loss_csv_path="results/loss.csv",
@@ -85,6 +154,8 @@ def example_with_real_ode_data():
 
 
 if __name__ == "__main__":
+    from visualizer import setup_backend
+
     setup_backend()
     # example_with_loss()        # Synthetic multi-parameter demo
     example_with_real_ode_data()  # Real PINN training results
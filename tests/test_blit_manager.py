@@ -0,0 +1,84 @@
+"""Tests for the blit manager module."""
+
+import pytest
+from unittest.mock import Mock
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from ui.blit_manager import BlitManager
+
+
+@pytest.fixture
+def fig():
+    """Create a figure on an Agg canvas."""
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    return figure
+
+
+class TestBlitManager:
+    """Test cases for BlitManager."""
+
+    def test_add_artist_marks_animated(self, fig):
+        """Test that managed artists are excluded from regular draws."""
+        ax = fig.add_subplot()
+        (line,) = ax.plot([0, 1], [0, 1])
+        manager = BlitManager(fig)
+
+        manager.add_artist(line)
+
+        assert line.get_animated()
+
+    def test_remove_unknown_artist_is_ignored(self, fig):
+        """Test that removing an unmanaged artist does not raise."""
+        ax = fig.add_subplot()
+        (line,) = ax.plot([0, 1], [0, 1])
+        manager = BlitManager(fig)
+
+        manager.remove_artist(line)
+
+    def test_draw_captures_background(self, fig):
+        """Test that a full draw caches the background for blitting."""
+        ax = fig.add_subplot()
+        (line,) = ax.plot([0, 1], [0, 1])
+        manager = BlitManager(fig)
+        manager.add_artist(line)
+
+        fig.canvas.draw()
+
+        assert manager._background is not None
+
+    def test_update_without_background_requests_full_draw(self, fig):
+        """Test that update falls back to draw_idle before the first draw."""
+        manager = BlitManager(fig)
+        fig.canvas.draw_idle = Mock()
+        fig.canvas.blit = Mock()
+
+        manager.update()
+
+        fig.canvas.draw_idle.assert_called_once()
+        fig.canvas.blit.assert_not_called()
+
+    def test_update_blits_managed_artists(self, fig):
+        """Test that update redraws only the managed artists and blits."""
+        ax = fig.add_subplot()
+        (line,) = ax.plot([0, 1], [0, 1])
+        manager = BlitManager(fig)
+        manager.add_artist(line)
+        fig.canvas.draw()
+        fig.canvas.blit = Mock()
+
+        line.set_ydata([1, 0])
+        manager.update()
+
+        fig.canvas.blit.assert_called_once_with(fig.bbox)
+
+    def test_invalidate_discards_background(self, fig):
+        """Test that invalidate forces a full redraw."""
+        manager = BlitManager(fig)
+        fig.canvas.draw()
+        fig.canvas.draw_idle = Mock()
+
+        manager.invalidate()
+
+        assert manager._background is None
+        fig.canvas.draw_idle.assert_called_once()
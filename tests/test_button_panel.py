@@ -0,0 +1,38 @@
+"""Tests for the button panel module."""
+
+import pytest
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from theme import DARK_THEME
+from ui.button_panel import ButtonPanel
+
+
+@pytest.fixture
+def panel():
+    """Create a ButtonPanel on an Agg figure."""
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return ButtonPanel(fig, DARK_THEME.to_dict())
+
+
+class TestButtonPanel:
+    """Test cases for ButtonPanel."""
+
+    def test_button_is_created_lazily(self, panel):
+        """Test that no button axes exists before first use."""
+        assert panel.button is None
+        assert panel.fig.axes == []
+
+    def test_disable_before_first_use(self, panel):
+        """Test that disable() creates the button and disables it."""
+        panel.disable()
+
+        assert panel.button is not None
+        assert not panel.button.get_active()
+
+    def test_enable_after_disable(self, panel):
+        """Test that enable() re-activates a disabled button."""
+        panel.disable()
+        panel.enable()
+
+        assert panel.button.get_active()
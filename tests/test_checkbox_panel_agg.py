@@ -0,0 +1,34 @@
+"""Tests for CheckboxPanel drawn on a real Agg figure."""
+
+import pytest
+from types import SimpleNamespace
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from theme import DARK_THEME
+from ui.checkbox_panel import CheckboxPanel
+
+
+@pytest.fixture
+def fig():
+    """Create a figure on an Agg canvas."""
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    return figure
+
+
+class TestCheckboxPanelAgg:
+    """Test cases for CheckboxPanel on an Agg canvas."""
+
+    def test_panel_label_deduplication(self, fig):
+        """Test that CheckboxPanel keeps the first color of a duplicate label."""
+        configs = [
+            SimpleNamespace(labels=["Label1", "Label2"], colors=["#c1", "#c2"]),
+            SimpleNamespace(labels=["Label2", "Label3"], colors=["#c3", "#c4"]),
+            SimpleNamespace(labels=["Label1", "Label4"], colors=["#c5", "#c6"]),
+        ]
+
+        panel = CheckboxPanel(fig, configs, DARK_THEME.to_dict())
+
+        assert panel.get_labels() == ("Label1", "Label2", "Label3", "Label4")
+        assert panel.get_colors()["Label1"] == "#c1"
+        assert panel.get_colors()["Label2"] == "#c2"
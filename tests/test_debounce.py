@@ -0,0 +1,76 @@
+"""Tests for the debounce module."""
+
+import pytest
+from unittest.mock import Mock
+from matplotlib.backend_bases import TimerBase
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from ui.debounce import DebouncedCallback
+
+
+class ManualTimer(TimerBase):
+    """Timer that only fires when the test says so."""
+
+    def _timer_start(self):
+        self.running = True
+
+    def _timer_stop(self):
+        self.running = False
+
+
+class ManualCanvas:
+    """Minimal canvas handing out manually driven timers."""
+
+    def __init__(self):
+        self.timers = []
+
+    def new_timer(self, interval=None, callbacks=None):
+        timer = ManualTimer(interval=interval, callbacks=callbacks)
+        self.timers.append(timer)
+        return timer
+
+
+class TestDebouncedCallback:
+    """Test cases for DebouncedCallback."""
+
+    def test_runs_synchronously_without_event_loop(self):
+        """Test that canvases without timers invoke the callback directly."""
+        canvas = FigureCanvasAgg(Figure())
+        callback = Mock()
+        debounced = DebouncedCallback(canvas, callback)
+
+        debounced("neurons", 20)
+
+        assert not debounced.deferred
+        callback.assert_called_once_with("neurons", 20)
+
+    def test_coalesces_burst_into_latest_call(self):
+        """Test that only the latest call of a burst runs."""
+        canvas = ManualCanvas()
+        callback = Mock()
+        debounced = DebouncedCallback(canvas, callback, interval=30)
+
+        for value in (10, 20, 30):
+            debounced("neurons", value)
+
+        assert debounced.deferred
+        assert debounced.pending
+        callback.assert_not_called()
+        assert [t.running for t in canvas.timers[1:]] == [False, False, True]
+
+        canvas.timers[-1]._on_timer()
+
+        callback.assert_called_once_with("neurons", 30)
+        assert not debounced.pending
+
+    def test_cancel_drops_pending_call(self):
+        """Test that cancel stops the pending timer."""
+        canvas = ManualCanvas()
+        callback = Mock()
+        debounced = DebouncedCallback(canvas, callback)
+
+        debounced("neurons", 10)
+        debounced.cancel()
+
+        assert not debounced.pending
+        assert not canvas.timers[-1].running
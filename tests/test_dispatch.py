@@ -0,0 +1,37 @@
+"""Tests for the callback dispatch module."""
+
+import pytest
+from ui.dispatch import notify_callbacks
+
+
+class TestNotifyCallbacks:
+    """Test cases for notify_callbacks."""
+
+    def test_calls_each_callback_in_order(self):
+        """Test that every callback receives the arguments."""
+        calls = []
+        callbacks = [
+            lambda name, value: calls.append(("first", name, value)),
+            lambda name, value: calls.append(("second", name, value)),
+        ]
+
+        notify_callbacks(callbacks, "neurons", 20)
+
+        assert calls == [("first", "neurons", 20), ("second", "neurons", 20)]
+
+    def test_failing_callback_does_not_stop_others(self):
+        """Test that errors are ignored and dispatch continues."""
+        calls = []
+
+        def failing():
+            raise RuntimeError("boom")
+
+        notify_callbacks(
+            [failing, lambda: calls.append(1), failing, lambda: calls.append(2)]
+        )
+
+        assert calls == [1, 2]
+
+    def test_none_means_no_callbacks(self):
+        """Test that None is accepted for an unallocated callback list."""
+        notify_callbacks(None, "label", True)
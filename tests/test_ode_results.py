@@ -0,0 +1,53 @@
+"""Tests for the ODE results view."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from views.ode_results import ODEResultsVisualizer
+
+
+class TestLoadLossCsv:
+    """Test cases for ODEResultsVisualizer._load_loss_csv."""
+
+    def test_extra_columns_are_ignored(self, tmp_path):
+        """Test that columns after the fifth do not shift the loss rows."""
+        path = tmp_path / "loss.csv"
+        path.write_text(
+            "iteration,total,bc,pde,supervised,lr\n"
+            "0,1.0,2.0,3.0,4.0,0.1\n"
+            "100,5.0,6.0,7.0,8.0,0.1\n"
+        )
+
+        iterations, values = ODEResultsVisualizer._load_loss_csv(str(path))
+        index = ODEResultsVisualizer._LOSS_INDEX
+
+        assert iterations.tolist() == [0, 100]
+        assert values[index["total"]].tolist() == [1.0, 5.0]
+        assert values[index["supervised"]].tolist() == [4.0, 8.0]
+
+    def test_rows_with_blank_iteration_are_skipped(self, tmp_path):
+        """Test that empty rows and rows without an iteration are dropped."""
+        path = tmp_path / "loss.csv"
+        path.write_text(
+            "iteration,total,bc,pde,supervised\n"
+            "0,1.0,2.0,3.0,4.0\n"
+            "\n"
+            " ,9.0,9.0,9.0,9.0\n"
+            "100,5.0,6.0,7.0,8.0\n"
+        )
+
+        iterations, values = ODEResultsVisualizer._load_loss_csv(str(path))
+
+        assert iterations.tolist() == [0, 100]
+        assert values.shape == (4, 2)
+
+    def test_header_only_file(self, tmp_path):
+        """Test that a file without data rows yields empty arrays."""
+        path = tmp_path / "loss.csv"
+        path.write_text("iteration,total,bc,pde,supervised\n")
+
+        iterations, values = ODEResultsVisualizer._load_loss_csv(str(path))
+
+        assert iterations.shape == (0,)
+        assert values.shape == (4, 0)
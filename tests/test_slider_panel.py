@@ -24,6 +24,7 @@ class TestSliderConfig:
         assert config.valmax == 100.0
         assert config.valinit == 50.0
         assert config.valstep == 1  # Default value
+        assert config.blit is True  # Default value
 
     def test_slider_config_with_custom_step(self):
         """Test SliderConfig with custom valstep."""
@@ -182,6 +183,96 @@ class TestSliderPanel:
         assert config.valmax == 100
 
 
+class TestSliderPanelDispatch:
+    """Test cases for SliderPanel event dispatch."""
+
+    @pytest.fixture
+    def panel(self):
+        """Create a SliderPanel with two sliders on an Agg figure."""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from theme import DARK_THEME
+        from ui.slider_panel import SliderPanel
+
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        configs = [
+            SliderConfig(name="a", label="A", valmin=0, valmax=10, valinit=0),
+            SliderConfig(name="b", label="B", valmin=0, valmax=10, valinit=0),
+        ]
+        return SliderPanel(fig, configs, DARK_THEME.to_dict())
+
+    def test_reentrant_events_are_coalesced(self, panel):
+        """Test that events raised by a callback run after it, latest value only."""
+        calls = []
+
+        def callback(name, value):
+            calls.append((name, value))
+            if name == "a":
+                panel.set_value("b", 3)
+                panel.set_value("b", 7)
+
+        panel.on_change(callback)
+        panel.set_value("a", 5)
+
+        assert calls == [("a", 5), ("b", 7)]
+        assert panel.get_value("b") == 7
+
+    def test_stale_value_is_not_delivered_to_remaining_callbacks(self, panel):
+        """Test that a newer value aborts the dispatch of the older one."""
+        first, second = [], []
+
+        def first_callback(name, value):
+            first.append(value)
+            if value == 5:
+                panel.set_value("a", 8)
+
+        panel.on_change(first_callback)
+        panel.on_change(lambda name, value: second.append(value))
+        panel.set_value("a", 5)
+
+        assert first == [5, 8]
+        assert second == [8]
+
+    def test_get_all_values_is_read_only_live_view(self, panel):
+        """Test that get_all_values tracks changes and rejects writes."""
+        values = panel.get_all_values()
+
+        panel.set_value("a", 4)
+
+        assert values["a"] == 4
+        with pytest.raises(TypeError):
+            values["a"] = 1
+
+    def test_executor_runs_callbacks_off_the_event(self, panel):
+        """Test that callbacks are submitted to the executor in order."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls = []
+        panel.executor = ThreadPoolExecutor(max_workers=1)
+        panel.on_change(lambda name, value: calls.append((name, value)))
+
+        panel.set_value("a", 2)
+        panel.set_value("b", 6)
+        panel.executor.shutdown(wait=True)
+
+        assert calls == [("a", 2), ("b", 6)]
+
+    def test_failing_callback_does_not_block_dispatch(self, panel):
+        """Test that later events are still delivered after a callback error."""
+        calls = []
+
+        def callback(name, value):
+            calls.append((name, value))
+            raise RuntimeError("boom")
+
+        panel.on_change(callback)
+        panel.set_value("a", 1)
+        panel.set_value("a", 2)
+
+        assert calls == [("a", 1), ("a", 2)]
+
+
 class TestSliderPanelIntegration:
     """Integration tests for SliderPanel with theme."""
 
@@ -1,6 +1,8 @@
 """Tests for the theme module."""
 
+import pickle
 import pytest
+from dataclasses import asdict
 from theme.colors import (
     Theme,
     get_theme,
@@ -54,6 +56,33 @@ class TestTheme:
         assert result["background"] == "#1e1e1e"
         assert result["axes_bg"] == "#2d2d2d"
         assert result["text"] == "#e0e0e0"
+        assert len(result) == 7
+
+    def test_theme_is_immutable(self):
+        """Test that theme colors cannot be reassigned."""
+        with pytest.raises(AttributeError):
+            DARK_THEME.background = "#ffffff"
+
+    def test_theme_mapping_access(self):
+        """Test that a theme can be used as a mapping of colors."""
+        theme = DARK_THEME
+
+        assert theme["text"] == DARK_THEME.text
+        assert len(theme) == 7
+        assert "accent" in theme
+        assert dict(theme) == theme.to_dict()
+        assert dict(**theme) == theme.to_dict()
+        assert list(theme) == list(theme.keys())
+
+        with pytest.raises(KeyError):
+            theme["to_dict"]
+
+    def test_theme_to_dict_returns_copy(self):
+        """Test that mutating to_dict() output leaves the theme untouched."""
+        result = DARK_THEME.to_dict()
+        result["background"] = "#ffffff"
+
+        assert DARK_THEME.to_dict()["background"] == "#1e1e1e"
 
     def test_theme_from_dict(self):
         """Test Theme.from_dict() creation."""
@@ -84,9 +113,22 @@ class TestTheme:
             "widget_active": "#0066cc",
         }
 
-        with pytest.raises(KeyError):
+        with pytest.raises(KeyError, match="text"):
             Theme.from_dict(data)
 
+    def test_theme_dict_round_trip(self):
+        """Test that to_dict() and asdict() output rebuilds an equal theme."""
+        assert Theme.from_dict(DARK_THEME.to_dict()) == DARK_THEME
+        assert Theme.from_dict(asdict(LIGHT_THEME)) == LIGHT_THEME
+        assert asdict(DARK_THEME) == DARK_THEME.to_dict()
+
+    def test_theme_pickle_round_trip(self):
+        """Test that pickled themes keep their colors and mapping access."""
+        theme = pickle.loads(pickle.dumps(DARK_THEME))
+
+        assert theme == DARK_THEME
+        assert dict(theme) == DARK_THEME.to_dict()
+
 
 class TestGetTheme:
     """Test cases for get_theme function."""
@@ -122,6 +164,12 @@ class TestGetTheme:
         theme = get_theme("dark_mode")
         assert theme == DARK_THEME
 
+    def test_get_prefix_match(self):
+        """Test that name prefixes resolve to the full theme."""
+        assert get_theme("lig") == LIGHT_THEME
+        assert get_theme("high") == HIGH_CONTRAST_THEME
+        assert get_theme("default") == DARK_THEME
+
 
 class TestListThemes:
     """Test cases for list_themes function."""
@@ -177,6 +225,33 @@ class TestRegisterTheme:
         theme = get_theme("mycustom")
         assert theme.background == "#000000"
 
+    def test_register_theme_keeps_earlier_partial_matches(self):
+        """Test that partial names still match the first registered theme."""
+        register_theme("contrast_x", LIGHT_THEME)
+
+        assert get_theme("con") == HIGH_CONTRAST_THEME
+
+        unregister_theme("contrast_x")
+
+    def test_register_theme_invalidates_cache(self):
+        """Test that a cached fallback lookup sees a newly registered theme."""
+        custom = Theme(
+            background="#010101",
+            axes_bg="#111111",
+            text="#222222",
+            grid="#333333",
+            accent="#444444",
+            widget_bg="#555555",
+            widget_active="#666666",
+        )
+
+        assert get_theme("cached_theme") == DARK_THEME
+        register_theme("cached_theme", custom)
+
+        assert get_theme("cached_theme") is custom
+
+        unregister_theme("cached_theme")
+
 
 class TestUnregisterTheme:
     """Test cases for unregister_theme function."""
@@ -198,6 +273,25 @@ class TestUnregisterTheme:
 
         assert result is True
         assert get_theme("temp_theme") == DARK_THEME  # Falls back to dark
+        assert get_theme("temp") == DARK_THEME  # Partial match removed too
+
+    def test_unregister_theme_invalidates_cache(self):
+        """Test that a cached lookup stops returning an unregistered theme."""
+        custom = Theme(
+            background="#020202",
+            axes_bg="#111111",
+            text="#222222",
+            grid="#333333",
+            accent="#444444",
+            widget_bg="#555555",
+            widget_active="#666666",
+        )
+
+        register_theme("cached_removed", custom)
+        assert get_theme("cached_removed") is custom
+
+        unregister_theme("cached_removed")
+        assert get_theme("cached_removed") == DARK_THEME
 
     def test_unregister_nonexistent_theme(self):
         """Test unregistering a theme that doesn't exist."""
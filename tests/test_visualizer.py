@@ -0,0 +1,82 @@
+"""Tests for the generalized visualizer."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from ui import SliderConfig
+from visualizer import GeneralizedVisualizer, PlotConfig
+
+
+@pytest.fixture
+def visualizer():
+    """Create a visualizer whose slider starts off its step grid (5, 15, ...)."""
+    runs = {key: np.full(3, float(key)) for key in (5, 15, 25, 35)}
+    vis = GeneralizedVisualizer(
+        data_dict={"loss": {"total": runs}},
+        plot_configs=[
+            PlotConfig(data_key="loss.total", title="Loss", xlabel="x", ylabel="y")
+        ],
+        slider_configs=[
+            SliderConfig(
+                name="run", label="Run", valmin=5, valmax=35, valinit=5, valstep=10
+            )
+        ],
+        layout=(1, 1),
+    )
+    yield vis
+    plt.close(vis.fig)
+
+
+class TestNestedLookup:
+    """Test cases for slider-keyed nested data lookups."""
+
+    def test_offset_slider_values_resolve_to_their_own_key(self, visualizer):
+        """Test that neighbouring slider values never share a lookup."""
+        for value in (15, 25, 35, 5, 25):
+            visualizer.slider_values["run"] = value
+            data = visualizer._get_plot_data("loss.total")
+            assert data[0] == value
+
+    def test_between_keys_picks_nearest(self, visualizer):
+        """Test that off-key slider values resolve to the nearest key."""
+        visualizer.slider_values["run"] = 23
+        assert visualizer._get_plot_data("loss.total")[0] == 25
+
+    def test_key_index_follows_changed_keys(self, visualizer):
+        """Test that keys added to slider-keyed data are picked up."""
+        runs = visualizer.data_dict["loss"]["total"]
+        visualizer.slider_values["run"] = 20
+        assert visualizer._get_plot_data("loss.total")[0] == 15
+
+        runs[20] = np.full(3, 20.0)
+        visualizer.slider_values["run"] = 21
+        assert visualizer._get_plot_data("loss.total")[0] == 20
+
+        del runs[20], runs[15]
+        visualizer.slider_values["run"] = 14
+        assert visualizer._get_plot_data("loss.total")[0] == 5
+
+    def test_key_index_follows_keys_replaced_in_place(self, visualizer):
+        """Test that swapping a key without changing the count is picked up."""
+        runs = visualizer.data_dict["loss"]["total"]
+        visualizer.slider_values["run"] = 14
+        assert visualizer._get_plot_data("loss.total")[0] == 15
+
+        del runs[15]
+        runs[16] = np.full(3, 16.0)
+        assert visualizer._get_plot_data("loss.total")[0] == 16
+
+    def test_ties_go_to_first_inserted_key(self, visualizer):
+        """Test that equally distant keys resolve in insertion order."""
+        visualizer.data_dict["loss"]["total"] = {
+            key: np.full(3, float(key)) for key in (25, 15, 35, 5)
+        }
+        visualizer.slider_values["run"] = 20
+        assert visualizer._get_plot_data("loss.total")[0] == 25
+
+        visualizer.slider_values["run"] = 10
+        assert visualizer._get_plot_data("loss.total")[0] == 15
@@ -1,10 +1,12 @@
 """Theme system for the neural network viewer."""
 
-from dataclasses import dataclass, asdict
-from typing import Dict, Optional
+from functools import lru_cache
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Dict, ItemsView, Iterator, KeysView, Optional, ValuesView
 
 
-@dataclass
+@dataclass(frozen=True)
 class Theme:
     """A theme configuration for the visualization.
 
@@ -26,8 +28,24 @@ class Theme:
         Background color for widgets (sliders, buttons)
     widget_active : str
         Active/highlighted color for widgets
+
+    A theme can also be used as a read-only mapping from color key to
+    color, e.g. ``theme["text"]``, ``dict(theme)`` or ``f(**theme)``.
     """
 
+    # Declared by hand instead of slots=True so the mapping view, which is
+    # not a dataclass field, gets a slot too
+    __slots__ = (
+        "background",
+        "axes_bg",
+        "text",
+        "grid",
+        "accent",
+        "widget_bg",
+        "widget_active",
+        "_view",
+    )
+
     background: str
     axes_bg: str
     text: str
@@ -36,6 +54,46 @@ class Theme:
     widget_bg: str
     widget_active: str
 
+    def __post_init__(self):
+        # Themes are immutable, so the read-only mapping is built only once
+        object.__setattr__(
+            self,
+            "_view",
+            MappingProxyType({key: getattr(self, key) for key in _COLOR_KEYS}),
+        )
+
+    def __getstate__(self):
+        return tuple(getattr(self, key) for key in _COLOR_KEYS)
+
+    def __setstate__(self, state):
+        for key, value in zip(_COLOR_KEYS, state):
+            object.__setattr__(self, key, value)
+        self.__post_init__()
+
+    def __getitem__(self, key: str) -> str:
+        return self._view[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._view)
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._view
+
+    def keys(self) -> KeysView[str]:
+        return self._view.keys()
+
+    def values(self) -> ValuesView[str]:
+        return self._view.values()
+
+    def items(self) -> ItemsView[str, str]:
+        return self._view.items()
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self._view.get(key, default)
+
     def to_dict(self) -> Dict[str, str]:
         """Convert theme to dictionary.
 
@@ -44,7 +102,7 @@ class Theme:
         dict
             Dictionary representation of the theme
         """
-        return asdict(self)
+        return dict(self._view)
 
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> "Theme":
@@ -65,21 +123,18 @@ class Theme:
         KeyError
             If required color keys are missing
         """
-        required_keys = [
-            "background",
-            "axes_bg",
-            "text",
-            "grid",
-            "accent",
-            "widget_bg",
-            "widget_active",
-        ]
-        for key in required_keys:
-            if key not in data:
-                raise KeyError(f"Missing required color key: {key}")
+        missing = _REQUIRED_KEYS.difference(data)
+        if missing:
+            raise KeyError(f"Missing required color key: {', '.join(sorted(missing))}")
         return cls(**data)
 
 
+# Color keys in declaration order, derived from the dataclass fields; all of
+# them are required by Theme.from_dict()
+_COLOR_KEYS = tuple(f.name for f in fields(Theme))
+_REQUIRED_KEYS = frozenset(_COLOR_KEYS)
+
+
 # Dark theme - optimized for low-light environments
 DARK_THEME = Theme(
     background="#1e1e1e",
@@ -113,7 +168,8 @@ HIGH_CONTRAST_THEME = Theme(
     widget_active="#ffff00",
 )
 
-# Available themes registry
+# Available themes registry. Change it through register_theme() and
+# unregister_theme() only; they clear the get_theme() lookup cache
 THEMES: Dict[str, Theme] = {
     "dark": DARK_THEME,
     "light": LIGHT_THEME,
@@ -121,9 +177,13 @@ THEMES: Dict[str, Theme] = {
 }
 
 
+@lru_cache(maxsize=32)
 def get_theme(name: str) -> Theme:
     """Get a theme by name.
 
+    Lookups are cached per name; the cache is cleared whenever themes are
+    registered or unregistered.
+
     Parameters:
     -----------
     name : str
@@ -177,6 +237,7 @@ def register_theme(name: str, theme: Theme):
         Theme configuration
     """
     THEMES[name.lower()] = theme
+    get_theme.cache_clear()
 
 
 def unregister_theme(name: str) -> bool:
@@ -195,5 +256,6 @@ def unregister_theme(name: str) -> bool:
     name_lower = name.lower()
     if name_lower in THEMES:
         del THEMES[name_lower]
+        get_theme.cache_clear()
         return True
     return False
@@ -6,10 +6,14 @@ Provides reusable UI widgets for visualization controls.
 from .checkbox_panel import CheckboxPanel
 from .slider_panel import SliderPanel, SliderConfig
 from .button_panel import ButtonPanel
+from .blit_manager import BlitManager
+from .debounce import DebouncedCallback
 
 __all__ = [
     "CheckboxPanel",
     "SliderPanel",
     "SliderConfig",
     "ButtonPanel",
+    "BlitManager",
+    "DebouncedCallback",
 ]
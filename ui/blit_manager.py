@@ -0,0 +1,100 @@
+"""Blit manager module for UI components."""
+
+from typing import List, Optional, Any
+
+
+class BlitManager:
+    """Redraws a set of animated artists on top of a cached figure background.
+
+    Artists registered with the manager are marked as animated, so regular
+    figure draws skip them. After every full draw the manager caches the
+    rendered background and paints the animated artists on top. Calling
+    :meth:`update` then restores that background and redraws only the
+    animated artists, which is much cheaper than re-rendering every axis,
+    tick and label of the figure.
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        The figure whose canvas is blitted. The canvas must support
+        blitting (see ``FigureCanvasBase.supports_blit``).
+    """
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.canvas = fig.canvas
+
+        # State
+        self._background: Optional[Any] = None
+        self._artists: List[Any] = []
+
+        # Re-capture the background after every full draw (including resizes)
+        self._draw_cid = self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        """Cache the freshly drawn background and paint animated artists."""
+        if self.canvas.is_saving():
+            # Saving renders into a different buffer; force a full redraw
+            # before the next blit instead of caching it
+            self._background = None
+            return
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        """Draw all animated artists whose axes are visible."""
+        for artist in self._artists:
+            if artist.axes is not None and not artist.axes.get_visible():
+                continue
+            self.fig.draw_artist(artist)
+
+    def add_artist(self, artist):
+        """Register an artist to be redrawn on every update.
+
+        Parameters:
+        -----------
+        artist : matplotlib.artist.Artist
+            Artist to manage. It is marked as animated.
+        """
+        artist.set_animated(True)
+        self._artists.append(artist)
+
+    def remove_artist(self, artist):
+        """Stop managing an artist.
+
+        Parameters:
+        -----------
+        artist : matplotlib.artist.Artist
+            Previously registered artist
+        """
+        try:
+            self._artists.remove(artist)
+        except ValueError:
+            pass
+
+    def invalidate(self):
+        """Discard the cached background and schedule a full redraw.
+
+        Use this when something other than the animated artists changed,
+        e.g. axis limits or subplot visibility.
+        """
+        self._background = None
+        self.canvas.draw_idle()
+
+    def update(self, bbox=None):
+        """Redraw the animated artists over the cached background.
+
+        Parameters:
+        -----------
+        bbox : matplotlib.transforms.BboxBase, optional
+            Display-space region that changed. Only this region is pushed
+            to the screen; the whole canvas buffer is still kept in sync.
+            Default: None (the whole figure)
+        """
+        if self._background is None:
+            # No valid background yet; the full draw will paint everything
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox if bbox is None else bbox)
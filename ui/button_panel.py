@@ -3,12 +3,15 @@
 from matplotlib.widgets import Button
 from typing import Dict, Callable, Optional, List, Tuple
 
+from .dispatch import notify_callbacks
+
 
 class ButtonPanel:
     """A panel containing action buttons for the visualization.
 
     This class manages buttons that trigger actions like resetting
-    slider values to their defaults.
+    slider values to their defaults. The button axes is only created once
+    the button is actually used (a callback is registered or it is styled).
 
     Parameters:
     -----------
@@ -33,13 +36,14 @@ class ButtonPanel:
 
         # State
         self.button: Optional[Button] = None
-        self._callbacks: List[Callable[[], None]] = []
+        # Allocated on first registration
+        self._callbacks: Optional[List[Callable[[], None]]] = None
 
-        # Create the button
-        self._create_widget()
+    def _ensure_widget(self):
+        """Create the reset button on first use."""
+        if self.button is not None:
+            return
 
-    def _create_widget(self):
-        """Create the reset button."""
         # Create button axis
         button_ax = self.fig.add_axes(list(self.position))
         button_ax.set_facecolor(self.colors["widget_bg"])
@@ -61,11 +65,7 @@ class ButtonPanel:
     def _on_click(self, event):
         """Handle button click event."""
         # Notify all registered callbacks
-        for callback in self._callbacks:
-            try:
-                callback()
-            except Exception:
-                pass  # Silently ignore callback errors
+        notify_callbacks(self._callbacks)
 
     def on_click(self, callback: Callable[[], None]):
         """Register a callback for button clicks.
@@ -76,6 +76,9 @@ class ButtonPanel:
             Function called when button is clicked.
             Signature: callback() -> None
         """
+        self._ensure_widget()
+        if self._callbacks is None:
+            self._callbacks = []
         self._callbacks.append(callback)
 
     def set_label(self, label: str):
@@ -86,8 +89,8 @@ class ButtonPanel:
         label : str
             New button label
         """
-        if self.button:
-            self.button.label.set_text(label)
+        self._ensure_widget()
+        self.button.label.set_text(label)
 
     def set_position(self, position: Tuple[float, float, float, float]):
         """Set the button position.
@@ -97,9 +100,9 @@ class ButtonPanel:
         position : tuple
             New position [left, bottom, width, height]
         """
-        if self.button:
+        self.position = position
+        if self.button is not None:
             self.button.ax.set_position(position)
-            self.position = position
 
     def set_color(self, color: str):
         """Set the button background color.
@@ -109,9 +112,9 @@ class ButtonPanel:
         color : str
             Color string (hex, name, etc.)
         """
-        if self.button:
-            self.button.color = color
-            self.button.ax.set_facecolor(color)
+        self._ensure_widget()
+        self.button.color = color
+        self.button.ax.set_facecolor(color)
 
     def set_hover_color(self, color: str):
         """Set the button hover color.
@@ -121,8 +124,8 @@ class ButtonPanel:
         color : str
             Color string (hex, name, etc.)
         """
-        if self.button:
-            self.button.hovercolor = color
+        self._ensure_widget()
+        self.button.hovercolor = color
 
     def set_text_color(self, color: str):
         """Set the button text color.
@@ -132,15 +135,15 @@ class ButtonPanel:
         color : str
             Color string (hex, name, etc.)
         """
-        if self.button:
-            self.button.label.set_color(color)
+        self._ensure_widget()
+        self.button.label.set_color(color)
 
     def disable(self):
-        """Disable the button (visually)."""
-        if self.button:
-            self.button.ax.set_sensitive(False)
+        """Disable the button so clicks are ignored."""
+        self._ensure_widget()
+        self.button.set_active(False)
 
     def enable(self):
         """Enable the button."""
-        if self.button:
-            self.button.ax.set_sensitive(True)
+        self._ensure_widget()
+        self.button.set_active(True)
@@ -1,7 +1,12 @@
 """Toggle button panel module for UI components."""
 
+from matplotlib.patches import Rectangle
 from matplotlib.widgets import Button
-from typing import Dict, List, Callable, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, List, Callable, Mapping, Optional, Tuple, Any
+
+from .blit_manager import BlitManager
+from .dispatch import notify_callbacks
 
 
 class CheckboxPanel:
@@ -11,6 +16,10 @@ class CheckboxPanel:
     and inactive (hidden) states. The entire panel can be collapsed or
     expanded via a header button.
 
+    All toggle buttons are drawn as rectangles inside a single Axes whose
+    data coordinates match figure coordinates; clicks are routed to the
+    button under the cursor by hit-testing the rectangles.
+
     Parameters:
     -----------
     fig : matplotlib.figure.Figure
@@ -22,6 +31,9 @@ class CheckboxPanel:
     position : tuple, optional
         Position [left, bottom, width, height] for the panel header
         Default: (0.01, 0.90, 0.10, 0.15)
+    blit_manager : BlitManager, optional
+        If given, toggle buttons are managed by it and hover highlights
+        only blit the panel instead of redrawing the figure. Default: None
     """
 
     # Layout constants
@@ -31,6 +43,7 @@ class CheckboxPanel:
     _HEADER_WIDTH = 0.03
     _PANEL_WIDTH = 0.11
     _BUTTON_COLOR = "#3a3a3a"
+    _MAX_LABEL_LENGTH = 18
 
     def __init__(
         self,
@@ -38,21 +51,34 @@ class CheckboxPanel:
         plot_configs,
         colors: Dict[str, str],
         position: Tuple[float, float, float, float] = (0.01, 0.90, 0.10, 0.15),
+        blit_manager: Optional[BlitManager] = None,
     ):
         self.fig = fig
         self.plot_configs = plot_configs
         self.colors = colors
         self.position = position
+        self.blit_manager = blit_manager
+
+        # Colors used by the event handlers, resolved once
+        self._c_text = colors["text"]
+        self._c_bg = colors["widget_bg"]
+        self._c_active = colors["widget_active"]
+        self._c_accent = colors["accent"]
 
         # Initialize state
         self.series_labels: List[str] = []
         self.series_colors: Dict[str, str] = {}
         self.series_visibility: Dict[str, bool] = {}
-        self._callbacks: List[Callable[[str, bool], None]] = []
-
-        # Toggle button widgets and axes
-        self._toggle_buttons: Dict[str, Button] = {}
-        self._toggle_axes: Dict[str, Any] = {}
+        self._display_labels: Dict[str, str] = {}
+        # Allocated on first registration
+        self._callbacks: Optional[List[Callable[[str, bool], None]]] = None
+
+        # Toggle button patches and labels, drawn in one shared axes
+        self._toggle_patches: Dict[str, Rectangle] = {}
+        self._toggle_texts: Dict[str, Any] = {}
+        self._panel_ax: Optional[Any] = None
+        self._hovered: Optional[str] = None
+        self._cids: List[int] = []
         self._header_button: Optional[Button] = None
         self._header_ax: Optional[Any] = None
         self._expanded = True
@@ -60,20 +86,40 @@ class CheckboxPanel:
         # Build the panel
         self._create_widgets()
 
+        # Read-only views handed out by the getters
+        self._visibility_view = MappingProxyType(self.series_visibility)
+        self._colors_view = MappingProxyType(self.series_colors)
+        self._labels_view = tuple(self.series_labels)
+
     def _create_widgets(self):
         """Create the toggle button widgets based on plot configurations."""
-        # Extract labels and colors from plot configs
-        for config in self.plot_configs:
-            if config.labels:
-                for i, label in enumerate(config.labels):
-                    if label not in self.series_labels:
-                        self.series_labels.append(label)
-                        if config.colors and i < len(config.colors):
-                            self.series_colors[label] = config.colors[i]
+        # Extract labels and colors from plot configs (first occurrence wins)
+        series = (
+            (
+                label,
+                config.colors[i] if config.colors and i < len(config.colors) else None,
+            )
+            for config in self.plot_configs
+            if config.labels
+            for i, label in enumerate(config.labels)
+        )
+        first_colors: Dict[str, Optional[str]] = {}
+        for label, color in series:
+            first_colors.setdefault(label, color)
+
+        self.series_labels = list(first_colors)
+        self.series_colors = {
+            label: color for label, color in first_colors.items() if color is not None
+        }
 
         # Initialize visibility state (all visible by default)
         self.series_visibility = {label: True for label in self.series_labels}
 
+        # Truncate long labels once; buttons are keyed by the original label
+        self._display_labels = dict(
+            zip(self.series_labels, map(self._truncate, self.series_labels))
+        )
+
         if not self.series_labels:
             return
 
@@ -89,53 +135,113 @@ class CheckboxPanel:
         self._header_button = Button(
             self._header_ax,
             "\u2630",
-            color=self.colors["accent"],
-            hovercolor=self.colors["widget_active"],
+            color=self._c_accent,
+            hovercolor=self._c_active,
         )
-        self._header_button.label.set_color(self.colors["text"])
+        self._header_button.label.set_color(self._c_text)
         self._header_button.label.set_fontsize(12)
         self._header_button.on_clicked(self._on_header_click)
 
+        # One frameless axes holding all toggle buttons; its data coordinates
+        # are figure coordinates, so the button rects keep their layout
+        step = self._BUTTON_HEIGHT + self._BUTTON_GAP
+        panel_top = header_top - step - self._BUTTON_GAP + self._BUTTON_HEIGHT
+        panel_bottom = header_top - len(self.series_labels) * step - self._BUTTON_GAP
+        panel_left = self.position[0]
+        self._panel_ax = self.fig.add_axes(
+            [panel_left, panel_bottom, self._PANEL_WIDTH, panel_top - panel_bottom],
+            frameon=False,
+        )
+        self._panel_ax.set_axis_off()
+        self._panel_ax.set_xlim(panel_left, panel_left + self._PANEL_WIDTH)
+        self._panel_ax.set_ylim(panel_bottom, panel_top)
+        self._panel_ax.set_navigate(False)
+
         # Create a toggle button for each series label
         for idx, label in enumerate(self.series_labels):
-            btn_top = (
-                header_top
-                - (idx + 1) * (self._BUTTON_HEIGHT + self._BUTTON_GAP)
-                - self._BUTTON_GAP
-            )
-            btn_pos = [
-                self.position[0],
-                btn_top,
+            btn_top = header_top - (idx + 1) * step - self._BUTTON_GAP
+
+            patch = Rectangle(
+                (panel_left, btn_top),
                 self._PANEL_WIDTH,
                 self._BUTTON_HEIGHT,
-            ]
+                facecolor=self._BUTTON_COLOR,
+                edgecolor="none",
+            )
+            self._panel_ax.add_patch(patch)
+            text = self._panel_ax.text(
+                panel_left + self._PANEL_WIDTH / 2,
+                btn_top + self._BUTTON_HEIGHT / 2,
+                self._display_labels[label],
+                color=self._c_text,
+                fontsize=9,
+                ha="center",
+                va="center",
+            )
 
-            ax = self.fig.add_axes(btn_pos)
-            display_label = label[:18] + ".." if len(label) > 18 else label
+            self._toggle_patches[label] = patch
+            self._toggle_texts[label] = text
+            if self.blit_manager is not None:
+                self.blit_manager.add_artist(patch)
+                self.blit_manager.add_artist(text)
 
-            btn = Button(
-                ax,
-                display_label,
-                color=self._BUTTON_COLOR,
-                hovercolor=self.colors["widget_active"],
-            )
-            btn.label.set_color(self.colors["text"])
-            btn.label.set_fontsize(9)
+        # Route clicks and hovers to the button under the cursor
+        self._cids = [
+            self.fig.canvas.mpl_connect("button_press_event", self._on_panel_click),
+            self.fig.canvas.mpl_connect("motion_notify_event", self._on_panel_hover),
+        ]
 
-            # Store and wire up
-            self._toggle_axes[label] = ax
-            self._toggle_buttons[label] = btn
-            btn.on_clicked(lambda event, lbl=label: self._on_toggle(lbl))
+    @classmethod
+    def _truncate(cls, label: str) -> str:
+        """Shorten a label to fit on a toggle button."""
+        limit = cls._MAX_LABEL_LENGTH
+        return label[:limit] + ".." if len(label) > limit else label
+
+    def _button_at(self, event) -> Optional[str]:
+        """Return the label of the toggle button under a mouse event, if any."""
+        if (
+            self._panel_ax is None
+            or event.inaxes is not self._panel_ax
+            or not self._panel_ax.get_visible()
+        ):
+            return None
+        for label, patch in self._toggle_patches.items():
+            if patch.contains(event)[0]:
+                return label
+        return None
+
+    def _on_panel_click(self, event):
+        """Toggle the series whose button was clicked."""
+        if event.button != 1:
+            return
+        label = self._button_at(event)
+        if label is not None:
+            self._on_toggle(label)
+
+    def _on_panel_hover(self, event):
+        """Highlight the toggle button under the cursor."""
+        label = self._button_at(event)
+        if label == self._hovered:
+            return
+
+        previous, self._hovered = self._hovered, label
+        if previous is not None:
+            self._update_button_style(previous, self.series_visibility[previous])
+        if label is not None:
+            self._toggle_patches[label].set_facecolor(self._c_active)
+
+        if self.blit_manager is not None:
+            self.blit_manager.update(self._panel_ax.bbox)
+        else:
+            self.fig.canvas.draw_idle()
 
     def _on_header_click(self, event):
         """Toggle the panel between expanded and collapsed states."""
         self._expanded = not self._expanded
 
-        # Show or hide all toggle buttons
-        for label in self.series_labels:
-            ax = self._toggle_axes.get(label)
-            if ax is not None:
-                ax.set_visible(self._expanded)
+        # Show or hide all toggle buttons at once
+        if self._panel_ax is not None:
+            self._panel_ax.set_visible(self._expanded)
 
         self.fig.canvas.draw_idle()
 
@@ -155,11 +261,7 @@ class CheckboxPanel:
         self._update_button_style(label, visible)
 
         # Notify all registered callbacks
-        for callback in self._callbacks:
-            try:
-                callback(label, visible)
-            except Exception:
-                pass  # Silently ignore callback errors
+        notify_callbacks(self._callbacks, label, visible)
 
         self.fig.canvas.draw_idle()
 
@@ -173,19 +275,17 @@ class CheckboxPanel:
         visible : bool
             Whether the series is visible (active)
         """
-        btn = self._toggle_buttons.get(label)
-        ax = self._toggle_axes.get(label)
-        if btn is None or ax is None:
+        patch = self._toggle_patches.get(label)
+        text = self._toggle_texts.get(label)
+        if patch is None or text is None:
             return
 
         if visible:
-            btn.color = self._BUTTON_COLOR
-            ax.set_facecolor(self._BUTTON_COLOR)
-            btn.label.set_alpha(1.0)
+            patch.set_facecolor(self._BUTTON_COLOR)
+            text.set_alpha(1.0)
         else:
-            btn.color = self.colors["widget_bg"]
-            ax.set_facecolor(self.colors["widget_bg"])
-            btn.label.set_alpha(0.4)
+            patch.set_facecolor(self._c_bg)
+            text.set_alpha(0.4)
 
     def on_visibility_changed(self, callback: Callable[[str, bool], None]):
         """Register a callback for visibility changes.
@@ -196,6 +296,8 @@ class CheckboxPanel:
             Function called when visibility changes.
             Signature: callback(label: str, visible: bool) -> None
         """
+        if self._callbacks is None:
+            self._callbacks = []
         self._callbacks.append(callback)
 
     def get_visibility(self, label: str) -> Optional[bool]:
@@ -213,7 +315,7 @@ class CheckboxPanel:
         """
         return self.series_visibility.get(label)
 
-    def set_visibility(self, label: str, visible: bool):
+    def set_visibility(self, label: str, visible: bool, redraw: bool = True):
         """Set visibility for a specific label programmatically.
 
         Parameters:
@@ -222,6 +324,8 @@ class CheckboxPanel:
             The series label
         visible : bool
             Whether the series should be visible
+        redraw : bool, optional
+            If True, request a canvas redraw afterwards. Default: True
         """
         if label not in self.series_visibility:
             return
@@ -230,21 +334,21 @@ class CheckboxPanel:
         self._update_button_style(label, visible)
 
         # Notify callbacks
-        for callback in self._callbacks:
-            try:
-                callback(label, visible)
-            except Exception:
-                pass
+        notify_callbacks(self._callbacks, label, visible)
 
-    def get_all_visibility(self) -> Dict[str, bool]:
+        if redraw:
+            self.fig.canvas.draw_idle()
+
+    def get_all_visibility(self) -> Mapping[str, bool]:
         """Get visibility state for all series.
 
         Returns:
         --------
-        dict
-            Dictionary mapping series labels to visibility state
+        mapping
+            Read-only live view mapping series labels to visibility state.
+            Use dict() on it for a snapshot.
         """
-        return self.series_visibility.copy()
+        return self._visibility_view
 
     def set_all_visibility(self, visible: bool):
         """Set visibility for all series.
@@ -254,28 +358,37 @@ class CheckboxPanel:
         visible : bool
             Whether all series should be visible
         """
-        for label in self.series_labels:
-            self.set_visibility(label, visible)
+        # Update every changed series first, then redraw once
+        changed = [
+            label
+            for label in self.series_labels
+            if self.series_visibility[label] != visible
+        ]
+        for label in changed:
+            self.set_visibility(label, visible, redraw=False)
+
+        if changed:
+            self.fig.canvas.draw_idle()
 
-    def get_labels(self) -> List[str]:
+    def get_labels(self) -> Tuple[str, ...]:
         """Get all series labels.
 
         Returns:
         --------
-        list
-            List of all series labels
+        tuple
+            All series labels, in panel order
         """
-        return self.series_labels.copy()
+        return self._labels_view
 
-    def get_colors(self) -> Dict[str, str]:
+    def get_colors(self) -> Mapping[str, str]:
         """Get color mapping for series.
 
         Returns:
         --------
-        dict
-            Dictionary mapping series labels to colors
+        mapping
+            Read-only view mapping series labels to colors
         """
-        return self.series_colors.copy()
+        return self._colors_view
 
     def is_expanded(self) -> bool:
         """Check if the panel is currently expanded.
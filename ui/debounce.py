@@ -0,0 +1,68 @@
+"""Debounce module for UI components."""
+
+from matplotlib.backend_bases import TimerBase
+from typing import Callable, Optional, Any
+
+
+class DebouncedCallback:
+    """Coalesces bursts of calls into a single deferred call.
+
+    Every call stops the pending timer and schedules a new one, so the
+    wrapped callback only runs once the calls have been quiet for
+    ``interval`` milliseconds, with the arguments of the latest call.
+
+    Canvases without an event loop (e.g. Agg) hand out timers that never
+    fire; in that case the callback is invoked synchronously instead.
+
+    Parameters:
+    -----------
+    canvas : matplotlib.backend_bases.FigureCanvasBase
+        Canvas used to create timers
+    callback : callable
+        Function to call with the arguments of the latest call
+    interval : int, optional
+        Quiet period in milliseconds. Default: 30
+    """
+
+    def __init__(
+        self,
+        canvas,
+        callback: Callable[..., Any],
+        interval: int = 30,
+    ):
+        self.canvas = canvas
+        self.callback = callback
+        self.interval = interval
+
+        # State
+        self._pending_timer: Optional[TimerBase] = None
+        self.deferred = type(canvas.new_timer()) is not TimerBase
+
+    def __call__(self, *args):
+        """Schedule the callback, cancelling any pending call."""
+        if not self.deferred:
+            self.callback(*args)
+            return
+
+        self.cancel()
+        self._pending_timer = self.canvas.new_timer(
+            interval=self.interval, callbacks=[(self._fire, list(args), {})]
+        )
+        self._pending_timer.single_shot = True
+        self._pending_timer.start()
+
+    def _fire(self, *args):
+        """Run the callback for the timer that just elapsed."""
+        self._pending_timer = None
+        self.callback(*args)
+
+    @property
+    def pending(self) -> bool:
+        """Whether a call is scheduled but has not run yet."""
+        return self._pending_timer is not None
+
+    def cancel(self):
+        """Drop the pending call, if any."""
+        if self._pending_timer is not None:
+            self._pending_timer.stop()
+            self._pending_timer = None
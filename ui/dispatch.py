@@ -0,0 +1,26 @@
+"""Callback dispatch helpers for UI components."""
+
+from typing import Callable, Iterable, Optional
+
+
+def notify_callbacks(callbacks: Optional[Iterable[Callable]], *args):
+    """Call every callback with the given arguments, ignoring their errors.
+
+    A single exception handler wraps the dispatch loop; when a callback
+    raises, the loop resumes with the next callback instead of aborting.
+
+    Parameters:
+    -----------
+    callbacks : iterable of callable or None
+        Callbacks to invoke, in order. None means no callbacks.
+    *args
+        Arguments passed to each callback
+    """
+    remaining = iter(callbacks or ())
+    while True:
+        try:
+            for callback in remaining:
+                callback(*args)
+            return
+        except Exception:
+            continue  # Silently ignore callback errors
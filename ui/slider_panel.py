@@ -1,7 +1,15 @@
 """Slider panel module for UI components."""
 
+from concurrent.futures import Executor
+from functools import partial
+from itertools import takewhile
+from matplotlib.transforms import Bbox
 from matplotlib.widgets import Slider
-from typing import Dict, List, Callable, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, List, Callable, Mapping, Optional, Tuple, Any
+
+from .blit_manager import BlitManager
+from .dispatch import notify_callbacks
 
 
 class SliderConfig:
@@ -24,6 +32,10 @@ class SliderConfig:
     position : tuple, optional
         Position [left, bottom, width, height] for the slider axis
         Default: (0.25, 0.1, 0.65, 0.03)
+    blit : bool, optional
+        If True and the panel has a BlitManager, redraw the slider and the
+        managed plot artists via blitting instead of a full figure redraw.
+        Default: True
     """
 
     def __init__(
@@ -35,6 +47,7 @@ class SliderConfig:
         valinit: float,
         valstep: Optional[float] = 1,
         position: Tuple[float, float, float, float] = (0.25, 0.1, 0.65, 0.03),
+        blit: bool = True,
     ):
         self.name = name
         self.label = label
@@ -43,6 +56,7 @@ class SliderConfig:
         self.valinit = valinit
         self.valstep = valstep
         self.position = position
+        self.blit = blit
 
 
 class SliderPanel:
@@ -59,6 +73,16 @@ class SliderPanel:
         Configuration for each slider
     colors : dict
         Color scheme dictionary with keys like 'text', 'accent', 'widget_bg', 'widget_active'
+    blit_manager : BlitManager, optional
+        Blit manager shared with the plots. Sliders whose config has
+        ``blit=True`` register their moving parts with it and are redrawn by
+        blitting after their callbacks ran. Default: None (full redraws)
+    executor : concurrent.futures.Executor, optional
+        If given, callbacks are submitted to it instead of running on the GUI
+        thread, so slow callbacks do not block slider events. Such callbacks
+        must not touch matplotlib artists; use a single-worker executor to
+        keep deliveries in order. Values that went stale before a callback
+        ran are skipped. Default: None (callbacks run synchronously)
     """
 
     def __init__(
@@ -66,17 +90,34 @@ class SliderPanel:
         fig,
         configs: List[SliderConfig],
         colors: Dict[str, str],
+        blit_manager: Optional[BlitManager] = None,
+        executor: Optional[Executor] = None,
     ):
         self.fig = fig
         self.configs = configs
+        self._configs_by_name: Dict[str, SliderConfig] = {c.name: c for c in configs}
         self.colors = colors
+        self.blit_manager = blit_manager
+        self.executor = executor
 
         # State
         self.sliders: Dict[str, Slider] = {}
         self.slider_values: Dict[str, float] = {
             config.name: config.valinit for config in configs
         }
-        self._callbacks: List[Callable[[str, float], None]] = []
+        # Allocated on first registration
+        self._callbacks: Optional[List[Callable[[str, float], None]]] = None
+
+        # Latest undelivered value per slider while callbacks are running
+        self._pending: Dict[str, float] = {}
+        self._in_flight = False
+
+        # Bumped on every change so a dispatch can tell it has gone stale
+        self._generations: Dict[str, int] = {config.name: 0 for config in configs}
+
+        # Read-only views handed out by the getters
+        self._values_view = MappingProxyType(self.slider_values)
+        self._configs_view = tuple(configs)
 
         # Build the slider panel
         self._create_widgets()
@@ -85,6 +126,9 @@ class SliderPanel:
         """Create all slider widgets."""
         slider_width = 0.50
         slider_left = 0.25
+        text_color = self.colors["text"]
+        track_color = self.colors["widget_bg"]
+        active_color = self.colors["widget_active"]
 
         for idx, config in enumerate(self.configs):
             # Calculate position
@@ -95,7 +139,7 @@ class SliderPanel:
             pos[1] = 0.04 - (idx * 0.038)
 
             # Create slider axis
-            ax_slider = self.fig.add_axes(pos, facecolor=self.colors["widget_bg"])
+            ax_slider = self.fig.add_axes(pos, facecolor=track_color)
 
             # Create the slider widget
             slider = Slider(
@@ -105,15 +149,21 @@ class SliderPanel:
                 valmax=config.valmax,
                 valinit=config.valinit,
                 valstep=config.valstep,
-                color=self.colors["widget_active"],
+                color=active_color,
             )
 
             # Apply text styling
-            slider.label.set_color(self.colors["text"])
-            slider.valtext.set_color(self.colors["text"])
+            slider.label.set_color(text_color)
+            slider.valtext.set_color(text_color)
+
+            # Let the blit manager redraw the moving parts of the slider
+            if self.blit_manager is not None and config.blit:
+                slider.drawon = False
+                for artist in (slider.poly, *ax_slider.lines, slider.valtext):
+                    self.blit_manager.add_artist(artist)
 
             # Register callback for value changes
-            slider.on_changed(lambda val, name=config.name: self._on_change(name, val))
+            slider.on_changed(partial(self._on_change, config.name))
 
             self.sliders[config.name] = slider
 
@@ -128,13 +178,85 @@ class SliderPanel:
             New value
         """
         self.slider_values[slider_name] = value
+        self._pending[slider_name] = value
+        self._generations[slider_name] = self._generations.get(slider_name, 0) + 1
+
+        # Events arriving while callbacks run (e.g. a callback moving another
+        # slider) are coalesced: only the latest value per slider is
+        # delivered, once the running dispatch has finished
+        if self._in_flight:
+            return
+
+        self._in_flight = True
+        try:
+            while self._pending:
+                name = next(iter(self._pending))
+                self._dispatch(name, self._pending.pop(name))
+        finally:
+            self._in_flight = False
+
+    def _dispatch(self, slider_name: str, value: float):
+        """Deliver a slider value to all callbacks and redraw.
+
+        Parameters:
+        -----------
+        slider_name : str
+            Name of the slider that changed
+        value : float
+            Value to deliver
+        """
+        # Notify all registered callbacks, stopping early once a newer value
+        # for this slider arrived; that value is dispatched right after
+        generation = self._generations[slider_name]
+
+        def is_current(*_) -> bool:
+            return self._generations[slider_name] == generation
+
+        if self.executor is not None:
+            # Hand a snapshot of the callbacks to the worker; the slider
+            # itself is still redrawn right away on the GUI thread
+            callbacks = tuple(self._callbacks or ())
+            self.executor.submit(
+                notify_callbacks, takewhile(is_current, callbacks), slider_name, value
+            )
+        else:
+            notify_callbacks(
+                takewhile(is_current, self._callbacks or ()), slider_name, value
+            )
+            if not is_current():
+                return
 
-        # Notify all registered callbacks
-        for callback in self._callbacks:
-            try:
-                callback(slider_name, value)
-            except Exception:
-                pass  # Silently ignore callback errors
+        if self.blit_manager is not None and self.uses_blit(slider_name):
+            self.blit_manager.update(self._slider_region(slider_name))
+
+    def _slider_region(self, name: str) -> Bbox:
+        """Display-space region covering a slider row, including its value text.
+
+        Plot changes are blitted by their owner, so a slider change only
+        needs to push its own row to the screen. The row extends to the
+        right edge of the figure so that a shrinking value text is erased.
+        """
+        slider = self.sliders[name]
+        region = Bbox.union([slider.ax.bbox, slider.valtext.get_window_extent()])
+        return Bbox.from_extents(region.x0, region.y0, self.fig.bbox.x1, region.y1)
+
+    def uses_blit(self, name: str) -> bool:
+        """Check if a slider is redrawn through the blit manager.
+
+        Parameters:
+        -----------
+        name : str
+            Slider name
+
+        Returns:
+        --------
+        bool
+            True if the slider blits after its callbacks, False otherwise
+        """
+        if self.blit_manager is None:
+            return False
+        config = self._configs_by_name.get(name)
+        return config is not None and config.blit
 
     def on_change(self, callback: Callable[[str, float], None]):
         """Register a callback for slider value changes.
@@ -145,6 +267,8 @@ class SliderPanel:
             Function called when a slider value changes.
             Signature: callback(name: str, value: float) -> None
         """
+        if self._callbacks is None:
+            self._callbacks = []
         self._callbacks.append(callback)
 
     def get_value(self, name: str) -> Optional[float]:
@@ -180,7 +304,7 @@ class SliderPanel:
         if name not in self.sliders:
             return False
 
-        config = next((c for c in self.configs if c.name == name), None)
+        config = self._configs_by_name.get(name)
         if config is None:
             return False
 
@@ -192,15 +316,16 @@ class SliderPanel:
 
         return True
 
-    def get_all_values(self) -> Dict[str, float]:
+    def get_all_values(self) -> Mapping[str, float]:
         """Get current values for all sliders.
 
         Returns:
         --------
-        dict
-            Dictionary mapping slider names to values
+        mapping
+            Read-only live view mapping slider names to values.
+            Use dict() on it for a snapshot.
         """
-        return self.slider_values.copy()
+        return self._values_view
 
     def reset(self, name: Optional[str] = None):
         """Reset sliders to initial values.
@@ -212,25 +337,25 @@ class SliderPanel:
         """
         if name is not None:
             if name in self.sliders:
-                config = next((c for c in self.configs if c.name == name), None)
+                config = self._configs_by_name.get(name)
                 if config:
                     self.sliders[name].reset()
                     self.slider_values[name] = config.valinit
         else:
             # Reset all sliders
-            for config in self.configs:
+            for config in self._configs_by_name.values():
                 self.sliders[config.name].reset()
                 self.slider_values[config.name] = config.valinit
 
-    def get_configs(self) -> List[SliderConfig]:
+    def get_configs(self) -> Tuple[SliderConfig, ...]:
         """Get slider configurations.
 
         Returns:
         --------
-        list
-            List of SliderConfig objects
+        tuple
+            SliderConfig objects, in panel order
         """
-        return self.configs.copy()
+        return self._configs_view
 
     def get_range(self, name: str) -> Optional[Tuple[float, float]]:
         """Get the min/max range for a slider.
@@ -245,7 +370,7 @@ class SliderPanel:
         tuple or None
             (min, max) range, or None if slider not found
         """
-        config = next((c for c in self.configs if c.name == name), None)
+        config = self._configs_by_name.get(name)
         if config is None:
             return None
         return (config.valmin, config.valmax)
@@ -265,7 +390,7 @@ class SliderPanel:
         bool
             True if value is valid, False otherwise
         """
-        config = next((c for c in self.configs if c.name == name), None)
+        config = self._configs_by_name.get(name)
         if config is None:
             return False
         return config.valmin <= value <= config.valmax
@@ -1,17 +1,26 @@
 """ODE results visualizer for real PINN training data."""
 
-import csv
 import json
 import numpy as np
 
-from math import factorial
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Tuple
 
-from visualizer import GeneralizedVisualizer, PlotConfig
+from visualizer import LOG_FLOOR, GeneralizedVisualizer, PlotConfig
 from ui import SliderConfig
 from theme import Theme
 
 
+@lru_cache(maxsize=8)
+def _inverse_factorials(n: int) -> np.ndarray:
+  """Return [1/0!, 1/1!, ..., 1/(n-1)!] as a read-only array."""
+  inv = np.ones(n)
+  if n > 1:
+    inv[1:] = np.cumprod(1.0 / np.arange(1, n))
+  inv.flags.writeable = False
+  return inv
+
+
 class ODEResultsVisualizer(GeneralizedVisualizer):
   """
   Visualizer for real ODE PINN training results.
@@ -21,6 +30,9 @@ class ODEResultsVisualizer(GeneralizedVisualizer):
   analytical ODE solution.
   """
 
+  # Row of each loss type in the loss value block (CSV column order)
+  _LOSS_INDEX = {"total": 0, "bc": 1, "pde": 2, "supervised": 3}
+
   def __init__(
     self,
     results_json_path: str,
@@ -34,17 +46,30 @@ class ODEResultsVisualizer(GeneralizedVisualizer):
     with open(results_json_path, "r") as f:
       snapshots = json.load(f)
 
+    # Convert coefficient lists to ndarrays once, at load time
+    for entry in snapshots:
+      entry["pinn_coefficients"] = np.asarray(
+        entry["pinn_coefficients"], dtype=np.float64
+      )
+
     self.iteration_to_snapshot: Dict[int, dict] = {
       entry["iteration"]: entry for entry in snapshots
     }
 
     # Extract constant data from first entry
     first = snapshots[0]
-    self.benchmark_coefficients = np.array(first["benchmark_coefficients"])
+    self.benchmark_coefficients = np.asarray(
+      first["benchmark_coefficients"], dtype=np.float64
+    )
     self.alpha_matrix = first["alpha_matrix"]
 
-    # Load loss CSV
-    self.loss_data = self._load_loss_csv(loss_csv_path)
+    # Load loss CSV: one contiguous (num_loss_types, L) block, one row per
+    # loss type; loss_data exposes the rows by name as views
+    self._loss_iterations, loss_values = self._load_loss_csv(loss_csv_path)
+    self._loss_values = loss_values.astype(np.float32)
+    self.loss_data: Dict[str, np.ndarray] = {"iteration": self._loss_iterations}
+    for loss_type, row in self._LOSS_INDEX.items():
+      self.loss_data[loss_type] = self._loss_values[row]
 
     # Precompute x data
     self.x_data = np.linspace(x_range[0], x_range[1], num_points)
@@ -53,13 +78,51 @@ class ODEResultsVisualizer(GeneralizedVisualizer):
     self._setup_analytical_solution()
     self.analytical_solution = self._compute_analytical_solution(self.x_data)
 
+    # Determine iteration range from data
+    iterations = sorted(self.iteration_to_snapshot.keys())
+
+    # Snapshots are immutable, so every PINN series (and its error) is
+    # evaluated once up front: (num_iter, N) @ (N, num_points)
+    self.iteration_to_row: Dict[int, int] = {
+      iteration: row for row, iteration in enumerate(iterations)
+    }
+    self._pinn_coefficients: Dict[int, np.ndarray] = {
+      iteration: self.iteration_to_snapshot[iteration]["pinn_coefficients"]
+      for iteration in iterations
+    }
+
+    # Factorial Vandermonde basis x**i / i!, shape (num_points, N), shared by
+    # the benchmark and every PINN snapshot
+    num_terms = max(
+      [len(self.benchmark_coefficients)]
+      + [len(c) for c in self._pinn_coefficients.values()]
+    )
+    self._vander_fact = np.vander(self.x_data, num_terms, increasing=True)
+    self._vander_fact *= _inverse_factorials(num_terms)
+
     # Compute benchmark power series (static)
-    self.benchmark_series = self._evaluate_factorial_power_series(
-      self.benchmark_coefficients, self.x_data
+    self.benchmark_series = (
+      self._vander_fact[:, : len(self.benchmark_coefficients)]
+      @ self.benchmark_coefficients
     )
 
-    # Determine iteration range from data
-    iterations = sorted(self.iteration_to_snapshot.keys())
+    self.pinn_series_matrix = self._evaluate_factorial_power_series_matrix(
+      [self._pinn_coefficients[iteration] for iteration in iterations]
+    )
+    self.pinn_error_matrix = np.abs(self.analytical_solution - self.pinn_series_matrix)
+    # Errors are only drawn on log axes; floor them once here instead of
+    # copying on every refresh
+    np.maximum(self.pinn_error_matrix, LOG_FLOOR, out=self.pinn_error_matrix)
+
+    # Everything above is evaluated in float64; the plotted arrays are kept
+    # as float32, which halves the dense matrices and the data handed to
+    # matplotlib on every refresh
+    self.x_data = self.x_data.astype(np.float32)
+    self.analytical_solution = self.analytical_solution.astype(np.float32)
+    self.benchmark_series = self.benchmark_series.astype(np.float32)
+    self.pinn_series_matrix = self.pinn_series_matrix.astype(np.float32)
+    self.pinn_error_matrix = self.pinn_error_matrix.astype(np.float32)
+
     iter_min = iterations[0]
     iter_max = iterations[-1]
     iter_step = iterations[1] - iterations[0] if len(iterations) > 1 else 100
@@ -79,6 +142,16 @@ class ODEResultsVisualizer(GeneralizedVisualizer):
     # Plot configs
     plot_configs = self._create_plot_configs()
 
+    # data_key -> handler(iteration), so _get_plot_data needs one lookup
+    self._data_handlers: Dict[str, Callable[[int], Optional[Dict]]] = {
+      "function_comparison": self._function_comparison_data,
+      "function_error": self._function_error_data,
+      "coefficient_comparison": self._coefficient_comparison_data,
+      "coefficient_error": self._coefficient_error_data,
+    }
+    for loss_type in self._LOSS_INDEX:
+      self._data_handlers[f"loss_{loss_type}"] = partial(self._loss_data, loss_type)
+
     # Build minimal data_dict (real routing happens in _get_plot_data)
     data_dict = {}
 
@@ -94,67 +167,113 @@ class ODEResultsVisualizer(GeneralizedVisualizer):
     )
 
   @staticmethod
-  def _load_loss_csv(path: str) -> Dict[str, np.ndarray]:
-    """Load loss data from CSV file."""
-    iterations = []
-    total = []
-    bc = []
-    pde = []
-    supervised = []
+  def _load_loss_csv(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Load loss data from CSV file.
+
+    Returns:
+    --------
+    tuple
+      (iterations, values): int64 iterations of shape (L,) sorted ascending,
+      and float64 losses of shape (num_loss_types, L) in _LOSS_INDEX order
+    """
     with open(path, "r") as f:
-      reader = csv.reader(f)
-      next(reader)  # skip header
-      for row in reader:
-        if not row or not row[0].strip():
-          continue
-        iterations.append(int(row[0]))
-        total.append(float(row[1]))
-        bc.append(float(row[2]))
-        pde.append(float(row[3]))
-        supervised.append(float(row[4]))
-    return {
-      "iteration": np.array(iterations),
-      "total": np.array(total),
-      "bc": np.array(bc),
-      "pde": np.array(pde),
-      "supervised": np.array(supervised),
-    }
+      next(f, None)  # skip header
+      # Rows whose first cell is blank are skipped, as are extra columns
+      rows = [line for line in f if line.split(",", 1)[0].strip()]
+    if rows:
+      # Parsed in C into one (rows, 5) array
+      table = np.loadtxt(
+        rows, delimiter=",", usecols=range(5), dtype=np.float64, ndmin=2
+      ).T
+    else:
+      table = np.empty((5, 0))
+    iterations = table[0].astype(np.int64)
+    if np.any(iterations[1:] < iterations[:-1]):
+      # Keep rows ordered by iteration so truncation is a prefix slice
+      order = np.argsort(iterations, kind="stable")
+      iterations = iterations[order]
+      table = table[:, order]
+    return iterations, np.ascontiguousarray(table[1:])
 
   def _setup_analytical_solution(self):
-    """Set up the analytical solution from the ODE coefficients."""
+    """Set up the analytical solution from the ODE coefficients.
+
+    The closed form depends on the roots of the characteristic equation,
+    so the case is chosen once here:
+
+    - "real": c1*exp(r1*x) + c2*exp(r2*x)
+    - "double": (c1 + c2*x) * exp(r*x)
+    - "complex": exp(alpha*x) * (c1*cos(beta*x) + c2*sin(beta*x))
+    """
     a2, a1, a0 = self.alpha_matrix
     # Characteristic equation: a2*r^2 + a1*r + a0 = 0
     discriminant = a1**2 - 4 * a2 * a0
-
-    sqrt_disc = np.sqrt(abs(discriminant))
-    self.r1 = (-a1 + sqrt_disc) / (2 * a2)
-    self.r2 = (-a1 - sqrt_disc) / (2 * a2)
+    tolerance = 1e-12 * max(a1**2, abs(4 * a2 * a0), 1.0)
 
     # Initial conditions from benchmark coefficients
     u0 = float(self.benchmark_coefficients[0])
     u_prime0 = float(self.benchmark_coefficients[1])
 
-    # Solve: c1 + c2 = u0, c1*r1 + c2*r2 = u_prime0
-    self.c1 = (u_prime0 - u0 * self.r2) / (self.r1 - self.r2)
-    self.c2 = u0 - self.c1
+    if discriminant > tolerance:
+      self._solution_case = "real"
+      sqrt_disc = np.sqrt(discriminant)
+      self.r1 = (-a1 + sqrt_disc) / (2 * a2)
+      self.r2 = (-a1 - sqrt_disc) / (2 * a2)
+      # Solve: c1 + c2 = u0, c1*r1 + c2*r2 = u_prime0
+      self.c1 = (u_prime0 - u0 * self.r2) / (self.r1 - self.r2)
+      self.c2 = u0 - self.c1
+    elif discriminant >= -tolerance:
+      self._solution_case = "double"
+      self.r1 = self.r2 = -a1 / (2 * a2)
+      # Solve: c1 = u0, c1*r + c2 = u_prime0
+      self.c1 = u0
+      self.c2 = u_prime0 - u0 * self.r1
+    else:
+      self._solution_case = "complex"
+      self.alpha = -a1 / (2 * a2)
+      self.beta = np.sqrt(-discriminant) / abs(2 * a2)
+      # Solve: c1 = u0, c1*alpha + c2*beta = u_prime0
+      self.c1 = u0
+      self.c2 = (u_prime0 - u0 * self.alpha) / self.beta
 
   def _compute_analytical_solution(self, x: np.ndarray) -> np.ndarray:
     """Compute exact analytical ODE solution at points x."""
-    return self.c1 * np.exp(self.r1 * x) + self.c2 * np.exp(self.r2 * x)
+    if self._solution_case == "real":
+      return self.c1 * np.exp(self.r1 * x) + self.c2 * np.exp(self.r2 * x)
+    if self._solution_case == "double":
+      return (self.c1 + self.c2 * x) * np.exp(self.r1 * x)
+    beta_x = self.beta * x
+    return np.exp(self.alpha * x) * (
+      self.c1 * np.cos(beta_x) + self.c2 * np.sin(beta_x)
+    )
 
-  def _evaluate_factorial_power_series(
-    self, coefficients: np.ndarray, x: np.ndarray
+  def _evaluate_factorial_power_series_matrix(
+    self, coefficient_list: List[np.ndarray]
   ) -> np.ndarray:
-    """Evaluate factorial-normalized power series.
+    """Evaluate many factorial-normalized power series at x_data in one matmul.
 
-    u(x) = sum(coeff[i] * x^i / i!) for i in 0..N-1
-
-    Matches Julia: sum(a[i] * x^(i-1) / fact[i] for i in 1:N)
+    Row k of the result is sum(coeff[i] * x^i / i!) over coefficient_list[k]
+    (matching Julia: sum(a[i] * x^(i-1) / fact[i] for i in 1:N)), evaluated
+    at self.x_data. Shorter coefficient vectors are zero-padded to the basis
+    width.
     """
-    result = np.zeros_like(x, dtype=float)
-    for i, coeff in enumerate(coefficients):
-      result += coeff * (x**i) / factorial(i)
-    return result
+    num_terms = self._vander_fact.shape[1]
+    coeff_matrix = np.zeros((len(coefficient_list), num_terms))
+    for row, coeffs in enumerate(coefficient_list):
+      coeff_matrix[row, : len(coeffs)] = coeffs
+    return coeff_matrix @ self._vander_fact.T
+
+  def _get_pinn_coefficients(self, iteration: int) -> np.ndarray:
+    """Return the PINN coefficients of a snapshot."""
+    return self._pinn_coefficients[iteration]
+
+  def _get_pinn_series(self, iteration: int) -> np.ndarray:
+    """Return the precomputed PINN power series of a snapshot."""
+    return self.pinn_series_matrix[self.iteration_to_row[iteration]]
+
+  def _get_pinn_error(self, iteration: int) -> np.ndarray:
+    """Return the precomputed |analytical - PINN| of a snapshot."""
+    return self.pinn_error_matrix[self.iteration_to_row[iteration]]
 
   def _create_plot_configs(self) -> List[PlotConfig]:
     """Create the 8 plot configurations."""
@@ -238,58 +357,56 @@ class ODEResultsVisualizer(GeneralizedVisualizer):
       ),
     ]
 
+  def _function_comparison_data(self, iteration: int) -> Optional[Dict]:
+    """Analytical, benchmark and PINN solutions at an iteration."""
+    if iteration not in self.iteration_to_row:
+      return None
+    return {
+      "analytical": {"x": self.x_data, "y": self.analytical_solution},
+      "benchmark": {"x": self.x_data, "y": self.benchmark_series},
+      "pinn": {"x": self.x_data, "y": self._get_pinn_series(iteration)},
+    }
+
+  def _function_error_data(self, iteration: int) -> Optional[Dict]:
+    """|analytical - PINN| at an iteration."""
+    if iteration not in self.iteration_to_row:
+      return None
+    return {"error": {"x": self.x_data, "y": self._get_pinn_error(iteration)}}
+
+  def _coefficient_comparison_data(self, iteration: int) -> Optional[Dict]:
+    """Benchmark and PINN coefficients at an iteration."""
+    if iteration not in self.iteration_to_row:
+      return None
+    pinn_coeffs = self._get_pinn_coefficients(iteration)
+    min_len = min(len(self.benchmark_coefficients), len(pinn_coeffs))
+    indices = np.arange(min_len)
+    return {
+      "benchmark": {"x": indices, "y": self.benchmark_coefficients[:min_len]},
+      "pinn": {"x": indices, "y": pinn_coeffs[:min_len]},
+    }
+
+  def _coefficient_error_data(self, iteration: int) -> Optional[Dict]:
+    """|benchmark - PINN| coefficients at an iteration."""
+    if iteration not in self.iteration_to_row:
+      return None
+    pinn_coeffs = self._get_pinn_coefficients(iteration)
+    min_len = min(len(self.benchmark_coefficients), len(pinn_coeffs))
+    indices = np.arange(min_len)
+    error = np.abs(self.benchmark_coefficients[:min_len] - pinn_coeffs[:min_len])
+    np.maximum(error, LOG_FLOOR, out=error)
+    return {"error": {"x": indices, "y": error}}
+
+  def _loss_data(self, loss_type: str, iteration: int) -> Dict:
+    """One loss curve truncated to the current iteration."""
+    # Dynamic truncation: show loss up to current iteration
+    end = np.searchsorted(self._loss_iterations, iteration, side="right")
+    x_vals = self._loss_iterations[:end]
+    y_vals = self._loss_values[self._LOSS_INDEX[loss_type], :end]
+    return {loss_type: {"x": x_vals, "y": y_vals}}
+
   def _get_plot_data(self, data_key: str):
     """Retrieve data for plotting based on current iteration slider value."""
-    iteration = int(round(self.slider_values["iteration"]))
-    snapshot = self.iteration_to_snapshot.get(iteration)
-
-    if data_key == "function_comparison":
-      if snapshot is None:
-        return None
-      pinn_coeffs = np.array(snapshot["pinn_coefficients"])
-      pinn_series = self._evaluate_factorial_power_series(pinn_coeffs, self.x_data)
-      return {
-        "analytical": {"x": self.x_data, "y": self.analytical_solution},
-        "benchmark": {"x": self.x_data, "y": self.benchmark_series},
-        "pinn": {"x": self.x_data, "y": pinn_series},
-      }
-
-    elif data_key == "function_error":
-      if snapshot is None:
-        return None
-      pinn_coeffs = np.array(snapshot["pinn_coefficients"])
-      pinn_series = self._evaluate_factorial_power_series(pinn_coeffs, self.x_data)
-      error = np.abs(self.analytical_solution - pinn_series)
-      return {"error": {"x": self.x_data, "y": error}}
-
-    elif data_key == "coefficient_comparison":
-      if snapshot is None:
-        return None
-      pinn_coeffs = np.array(snapshot["pinn_coefficients"])
-      min_len = min(len(self.benchmark_coefficients), len(pinn_coeffs))
-      indices = np.arange(min_len)
-      return {
-        "benchmark": {"x": indices, "y": self.benchmark_coefficients[:min_len]},
-        "pinn": {"x": indices, "y": pinn_coeffs[:min_len]},
-      }
-
-    elif data_key == "coefficient_error":
-      if snapshot is None:
-        return None
-      pinn_coeffs = np.array(snapshot["pinn_coefficients"])
-      min_len = min(len(self.benchmark_coefficients), len(pinn_coeffs))
-      indices = np.arange(min_len)
-      error = np.abs(self.benchmark_coefficients[:min_len] - pinn_coeffs[:min_len])
-      return {"error": {"x": indices, "y": error}}
-
-    elif data_key.startswith("loss_"):
-      loss_type = data_key[5:]  # "total", "bc", "pde", "supervised"
-      if loss_type not in self.loss_data:
-        return None
-      # Dynamic truncation: show loss up to current iteration
-      mask = self.loss_data["iteration"] <= iteration
-      x_vals = self.loss_data["iteration"][mask]
-      y_vals = self.loss_data[loss_type][mask]
-      return {loss_type: {"x": x_vals, "y": y_vals}}
-
-    return None
+    handler = self._data_handlers.get(data_key)
+    if handler is None:
+      return None
+    return handler(int(round(self.slider_values["iteration"])))
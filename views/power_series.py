@@ -5,7 +5,7 @@ import numpy as np
 
 from typing import Dict, List, Optional, Tuple
 
-from visualizer import GeneralizedVisualizer, PlotConfig
+from visualizer import LOG_FLOOR, GeneralizedVisualizer, PlotConfig
 from ui import SliderConfig
 
 
@@ -54,16 +54,16 @@ class PowerSeriesVisualizer(GeneralizedVisualizer):
       predicted_coeffs = json.load(f)
 
     # Handle both old format (integer keys) and new format (string keys like "n10_h1_a10000")
-    data_keys = list(predicted_coeffs.keys())
+    # A file uses one format throughout, so the first key decides
+    first_key = next(iter(predicted_coeffs), None)
+    is_new_format = isinstance(first_key, str) and first_key.startswith("n")
 
-    # Check if using new multi-param format (keys start with 'n')
-    is_new_format = any(isinstance(k, str) and k.startswith("n") for k in data_keys)
-
-    if not is_new_format:
-      # Old format: convert integer keys
-      predicted_coeffs = {
-        int(k): np.array(v) for k, v in predicted_coeffs.items()
-      }
+    if is_new_format:
+      data_keys = list(predicted_coeffs)
+    else:
+      # Old format: convert integer keys; the coefficient lists are packed
+      # into one array in _prepare_data
+      predicted_coeffs = {int(k): v for k, v in predicted_coeffs.items()}
       data_keys = sorted(predicted_coeffs.keys())
 
     # Determine neuron range from data
@@ -96,6 +96,18 @@ class PowerSeriesVisualizer(GeneralizedVisualizer):
       predicted_coeffs, true_coefficients, x_data, loss_data, data_keys
     )
 
+    # Parse every key once so nearest-key lookups are a single reduction
+    parsed_keys = [(key, self._parse_key(key)) for key in data_keys]
+    self._key_list = [key for key, params in parsed_keys if params is not None]
+    self._key_params = np.array(
+      [params for _, params in parsed_keys if params is not None], dtype=np.float64
+    ).reshape(-1, 3)
+    # Per-dimension weights of the L1 distance between keys
+    self._key_weights = np.array([1.0, 10.0, 1.0 / 1000.0])
+    # (neurons, hidden_layers, adam_iterations) -> resolved data key
+    self._lookup_cache: Dict[Tuple[int, int, int], object] = {}
+    self._error_cache: Dict[Tuple[str, object], Optional[Dict]] = {}
+
     # Define plot configurations
     plot_configs = self._create_plot_configs(loss_data is not None)
 
@@ -156,42 +168,59 @@ class PowerSeriesVisualizer(GeneralizedVisualizer):
   ):
     """Prepare all data needed for plots."""
     data = {}
-    # Compute solutions for each data key (can be neuron count or multi-param key)
-    true_solution = self._evaluate_power_series(true_coeffs, x_data)
-    solutions = {}
+    raw_coeffs = [predicted_coeffs[key] for key in data_keys]
+
+    # Evaluate the true series and every predicted series in one matmul:
+    # pad all coefficient vectors to a common degree, then
+    # (num_series, degree + 1) @ (degree + 1, num_points)
+    num_terms = max([len(true_coeffs)] + [len(c) for c in raw_coeffs])
+    coeff_matrix = np.zeros((len(raw_coeffs) + 1, num_terms))
+    coeff_matrix[0, : len(true_coeffs)] = true_coeffs
+    for row, pred_coeffs in enumerate(raw_coeffs, start=1):
+      coeff_matrix[row, : len(pred_coeffs)] = pred_coeffs
+    # Per-key coefficients are views into the packed rows, not separate arrays
+    pred_coeffs_list = [
+      coeff_matrix[row, : len(c)] for row, c in enumerate(raw_coeffs, start=1)
+    ]
+    basis = np.vander(x_data, num_terms, increasing=True)
+    # Evaluated in float64, stored as float32 for plotting: halves the block
+    # and the data handed to matplotlib
+    curves = (coeff_matrix @ basis.T).astype(np.float32)
+    true_solution = curves[0]
+    pred_solutions = curves[1:]
+    # Coefficient errors of every key in one subtract; row i is only valid
+    # up to min(len(true), len(pred_i)) since the rest is padding. Errors are
+    # only drawn on log axes, so they are floored here instead of per refresh
+    coeff_delta = coeff_matrix[1:] - coeff_matrix[0]
+    coeff_error = np.abs(coeff_delta)
+    np.maximum(coeff_error, LOG_FLOOR, out=coeff_error)
+    coeff_errors = {
+      "delta": coeff_delta,
+      "y": coeff_error,
+      "lengths": [min(len(true_coeffs), len(c)) for c in pred_coeffs_list],
+    }
+
+    # All predicted curves stay in one (num_keys, num_points) block; data keys
+    # (neuron count or multi-param key) map to its rows
+    solutions = {
+      "x": x_data.astype(np.float32),
+      "y_true": true_solution,
+      "y_pred": pred_solutions,
+      "basis": basis,
+      "key_to_row": {key: row for row, key in enumerate(data_keys)},
+    }
     coeff_comparisons = {}
-    coeff_errors = {}
-    solution_errors = {}
-    for key in data_keys:
-      pred_coeffs = predicted_coeffs[key]
-      pred_coeffs = np.array(pred_coeffs)
-      pred_solution = self._evaluate_power_series(pred_coeffs, x_data)
-      solutions[key] = {
-        "x": x_data,
-        "y_true": true_solution,
-        "y_pred": pred_solution,
-      }
+    for key, pred_coeffs in zip(data_keys, pred_coeffs_list):
       # Coefficient comparison
       coeff_idx = np.arange(len(pred_coeffs))
       coeff_comparisons[key] = {
         "benchmark": {"x": coeff_idx, "y": true_coeffs[: len(pred_coeffs)]},
         "pinn": {"x": coeff_idx, "y": pred_coeffs},
       }
-      # Coefficient errors
-      min_len = min(len(true_coeffs), len(pred_coeffs))
-      coeff_errors[key] = {
-        "x": np.arange(min_len),
-        "y": np.abs(true_coeffs[:min_len] - pred_coeffs[:min_len]),
-      }
-      # Solution errors
-      solution_errors[key] = {
-        "x": x_data,
-        "y": np.abs(true_solution - pred_solution),
-      }
     data["solutions"] = solutions
     data["coeff_comparisons"] = coeff_comparisons
     data["coeff_errors"] = coeff_errors
-    data["solution_errors"] = solution_errors
+    # Solution errors are derived on demand in _get_error_data
     # Add loss data if provided
     if loss_data is not None:
       data["loss_data"] = loss_data
@@ -298,83 +327,101 @@ class PowerSeriesVisualizer(GeneralizedVisualizer):
       )
     return configs
 
-  def _evaluate_power_series(self, coefficients, x):
-    """Evaluate power series."""
-    result = np.zeros_like(x)
-    for i, coeff in enumerate(coefficients):
-      result += coeff * (x**i)
-    return result
+  @staticmethod
+  def _parse_key(key) -> Optional[Tuple[int, int, int]]:
+    """Parse a data key into (neurons, hidden_layers, adam_iterations)."""
+    if isinstance(key, int):
+      return (key, 1, 10000)  # Old format: just neuron count
+    if isinstance(key, str) and key.startswith("n"):
+      parts = key.split("_")
+      try:
+        n = int(parts[0][1:])
+        h = int(parts[1][1:]) if len(parts) > 1 else 1
+        a = int(parts[2][1:]) if len(parts) > 2 else 10000
+        return (n, h, a)
+      except (ValueError, IndexError):
+        pass
+    return None
 
-  def _get_plot_data(self, data_key: str):
-    """Override to handle power series specific data retrieval."""
-    # Get all slider values
-    neurons = int(round(self.slider_values["neurons"]))
-    hidden_layers = int(round(self.slider_values["hidden_layers"]))
-    adam_iterations = int(round(self.slider_values["adam_iterations"]))
+  def _resolve_key(self, neurons: int, hidden_layers: int, adam_iterations: int):
+    """Return the data key matching the slider values, or the nearest one."""
+    params = (neurons, hidden_layers, adam_iterations)
+    if params in self._lookup_cache:
+      return self._lookup_cache[params]
 
-    # Build lookup key for multi-dimensional data
     # Format: "n{neurons}_h{hidden_layers}_a{adam_iterations}"
     lookup_key = f"n{neurons}_h{hidden_layers}_a{adam_iterations}"
+    key_to_row = self.data_dict["solutions"]["key_to_row"]
+    if lookup_key not in key_to_row and key_to_row:
+      if self._key_list:
+        # Weighted L1 distance to every parsed key at once
+        distances = np.abs(self._key_params - params) @ self._key_weights
+        lookup_key = self._key_list[int(distances.argmin())]
+      else:
+        # No parseable keys: fall back to the first available one
+        lookup_key = next(iter(key_to_row))
+
+    self._lookup_cache[params] = lookup_key
+    return lookup_key
+
+  def _get_error_data(self, data_key: str, lookup_key) -> Optional[Dict]:
+    """Derive (and memoize) an error series from the stored base data."""
+    cache_key = (data_key, lookup_key)
+    if cache_key in self._error_cache:
+      return self._error_cache[cache_key]
+
+    result = None
+    solutions = self.data_dict["solutions"]
+    row = solutions["key_to_row"].get(lookup_key)
+    if row is not None and data_key == "coeff_errors":
+      coeff_errors = self.data_dict["coeff_errors"]
+      min_len = coeff_errors["lengths"][row]
+      result = {
+        "error": {"x": np.arange(min_len), "y": coeff_errors["y"][row, :min_len]}
+      }
+    elif row is not None:
+      # pred - true == basis @ (c_pred - c_true); evaluating the coefficient
+      # delta in float64 avoids cancellation in the float32 curves
+      delta = self.data_dict["coeff_errors"]["delta"][row]
+      error = np.abs(solutions["basis"] @ delta)
+      np.maximum(error, LOG_FLOOR, out=error)
+      error = error.astype(np.float32)
+      result = {"error": {"x": solutions["x"], "y": error}}
+
+    self._error_cache[cache_key] = result
+    return result
 
-    # Find nearest available key if exact match doesn't exist
-    available_keys = list(self.data_dict["solutions"].keys())
-    if lookup_key not in available_keys:
-      # Fallback: try to find nearest by neurons (for backward compatibility)
-      # or use first available key
-      if available_keys:
-        # Try to parse keys and find nearest match
-        def parse_key(k):
-          if isinstance(k, int):
-            return (k, 1, 10000)  # Old format: just neuron count
-          if isinstance(k, str) and k.startswith("n"):
-            parts = k.split("_")
-            try:
-              n = int(parts[0][1:])
-              h = int(parts[1][1:]) if len(parts) > 1 else 1
-              a = int(parts[2][1:]) if len(parts) > 2 else 10000
-              return (n, h, a)
-            except (ValueError, IndexError):
-              pass
-          return None
+  def _current_key(self):
+    """Return the data key for the current slider values."""
+    return self._resolve_key(
+      int(round(self.slider_values["neurons"])),
+      int(round(self.slider_values["hidden_layers"])),
+      int(round(self.slider_values["adam_iterations"])),
+    )
 
-        def distance(k):
-          parsed = parse_key(k)
-          if parsed is None:
-            return float("inf")
-          n, h, a = parsed
-          return (
-            abs(n - neurons)
-            + abs(h - hidden_layers) * 10
-            + abs(a - adam_iterations) / 1000
-          )
+  def _data_signature(self):
+    """Plots only change when the slider values resolve to another key."""
+    return self._current_key()
 
-        lookup_key = min(available_keys, key=distance)
+  def _get_plot_data(self, data_key: str):
+    """Override to handle power series specific data retrieval."""
+    lookup_key = self._current_key()
 
     if data_key == "solutions":
-      sol_data = self.data_dict["solutions"].get(lookup_key)
-      if sol_data is None:
+      solutions = self.data_dict["solutions"]
+      row = solutions["key_to_row"].get(lookup_key)
+      if row is None:
         return None
       return {
-        "true": {"x": sol_data["x"], "y": sol_data["y_true"]},
-        "pred": {"x": sol_data["x"], "y": sol_data["y_pred"]},
+        "true": {"x": solutions["x"], "y": solutions["y_true"]},
+        "pred": {"x": solutions["x"], "y": solutions["y_pred"][row]},
       }
 
     elif data_key == "coeff_comparisons":
       return self.data_dict["coeff_comparisons"].get(lookup_key)
 
-    elif data_key == "coeff_errors":
-      error_data = self.data_dict["coeff_errors"].get(lookup_key)
-      if error_data is None:
-        return None
-      # Return single series for error plot
-      return {"error": {"x": error_data["x"], "y": error_data["y"]}}
-
-    elif data_key == "solution_errors":
-      error_data = self.data_dict["solution_errors"].get(lookup_key)
-      if error_data is None:
-        return None
-      # Return single series for error plot
-      return {"error": {"x": error_data["x"], "y": error_data["y"]}}
+    elif data_key in ("coeff_errors", "solution_errors"):
+      return self._get_error_data(data_key, lookup_key)
 
     elif data_key == "loss_data":
       if "loss_data" not in self.data_dict:
@@ -5,35 +5,93 @@ Supports multiple subplots with different configurations, interactive sliders,
 automatic data updates, and flexible plot types (line, scatter, log scale, etc.).
 """
 
+import importlib.util
+import os
+import sys
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 
+from functools import lru_cache
 from matplotlib.gridspec import GridSpec
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
 from theme import get_theme, Theme, DARK_THEME
-from ui import CheckboxPanel, SliderPanel, SliderConfig, ButtonPanel
+from ui import (
+    CheckboxPanel,
+    SliderPanel,
+    SliderConfig,
+    ButtonPanel,
+    BlitManager,
+    DebouncedCallback,
+)
+
+
+# Interactive backends in order of preference, each with the modules it can
+# run on; QtAgg covers every Qt binding and is the fastest of them
+_BACKEND_CANDIDATES = [
+    ("QtAgg", ("PyQt6", "PySide6", "PyQt5", "PySide2")),
+    ("TkAgg", ("tkinter",)),
+    ("GTK3Agg", ("gi",)),
+    ("WXAgg", ("wx",)),
+]
 
 
 # Try to find a working interactive backend
 def setup_backend():
     """
-    Try different backends until one works.
+    Select the first interactive backend whose toolkit is installed.
+
+    Toolkits are probed with importlib.util.find_spec, so no figure or
+    canvas is created just to test a backend. Without a display (e.g. a
+    Linux session with neither DISPLAY nor WAYLAND_DISPLAY) or without any
+    usable toolkit, the non-interactive Agg backend is selected.
+
+    Returns:
+    --------
+    bool
+      True if an interactive backend was selected, False for Agg
     """
-    backends = ["Qt5Agg", "TkAgg", "GTK3Agg", "WXAgg"]
-
-    for backend in backends:
-        try:
-            matplotlib.use(backend, force=True)
-            # Test if backend works
-            fig = plt.figure()
-            plt.close(fig)
+    headless = sys.platform.startswith("linux") and not (
+        os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+    )
+    if not headless:
+        for backend, modules in _BACKEND_CANDIDATES:
+            if not any(importlib.util.find_spec(module) for module in modules):
+                continue
+            try:
+                matplotlib.use(backend)
+            except ImportError:
+                continue
             print(f"Using backend: {backend}")
             return True
-        except (ImportError, ModuleNotFoundError):
-            continue
+
+    matplotlib.use("Agg")
+    print("Using backend: Agg (no interactive display available)")
+    return False
+
+
+# Smallest value drawn on log-scaled axes. Data that is only shown on log
+# axes (e.g. errors) can be floored once when it is built to skip the copy
+# in _clip_log
+LOG_FLOOR = 1e-10
+
+
+@lru_cache(maxsize=32)
+def _index_range(n: int) -> np.ndarray:
+    """Return np.arange(n) as a shared, read-only array."""
+    indices = np.arange(n)
+    indices.flags.writeable = False
+    return indices
+
+
+def _clip_log(y_data) -> np.ndarray:
+    """Floor y_data at LOG_FLOOR, copying only if some value is below it."""
+    y_data = np.asarray(y_data)
+    if y_data.size == 0 or y_data.min() >= LOG_FLOOR:
+        return y_data
+    return np.maximum(y_data, LOG_FLOOR)
 
 
 @dataclass
@@ -72,6 +130,7 @@ class GeneralizedVisualizer:
         main_title: str = "Analysis Dashboard",
         hide_empty_plots: bool = True,
         theme: Optional[Theme] = None,
+        drag_decimation: int = 4,
     ):
         """
         Initialize the generalized visualizer.
@@ -99,8 +158,17 @@ class GeneralizedVisualizer:
           If True, automatically hide plots that have no data/lines
         theme : Theme, optional
           Color theme. Defaults to DARK_THEME.
+        drag_decimation : int
+          While a slider is being dragged, line and log plots only draw
+          every n-th point; full resolution is restored once the slider
+          rests. Use 1 to always draw every point.
         """
         self.data_dict = data_dict
+        # data_key -> (key set, sorted numeric keys, keys as floats, insertion
+        # position of each sorted key) of slider-dependent data
+        self._key_index: Dict[
+            str, Tuple[frozenset, List[Any], np.ndarray, List[int]]
+        ] = {}
         self.plot_configs = plot_configs
         self.slider_configs = slider_configs
         self.layout = layout
@@ -108,7 +176,9 @@ class GeneralizedVisualizer:
         self.main_title = main_title
         self.hide_empty_plots = hide_empty_plots
         self.theme = theme if theme is not None else DARK_THEME
-        self.colors = self.theme.to_dict()
+        self.colors = self.theme  # Themes are read-only color mappings
+        self.drag_decimation = max(1, int(drag_decimation))
+        self._drag_stride = 1
 
         # Store current slider values
         self.slider_values = {config.name: config.valinit for config in slider_configs}
@@ -140,23 +210,60 @@ class GeneralizedVisualizer:
             wspace=0.45,
         )
 
+        # Redraw plot lines by blitting when the canvas supports it
+        self._blit_manager = (
+            BlitManager(self.fig) if self.fig.canvas.supports_blit else None
+        )
+
         # Create subplots with GridSpec for equal sizing
         self.axes = []
         self.lines = {}  # Store line objects for updating
-
+        self._series_keys = {}  # Data keys of the series behind each line
+        self._stale_plots = set()  # Hidden plots not updated since hiding
+        # plot_type -> method that creates the artists of a plot
+        self._plot_dispatch = {
+            "line": self._plot_lines,
+            "semilogy": self._plot_semilogy,
+            "scatter": self._plot_scatter,
+        }
+        # Plot artists by label; None until built, reset when artists change
+        self._lines_by_label: Optional[Dict[str, List[Any]]] = None
+
+        # Theme styling is applied through rcParams while the axes are
+        # created instead of per-artist setters on every axis
         gs = GridSpec(layout[0], layout[1], figure=self.fig)
-        for idx, config in enumerate(plot_configs):
-            ax = self.fig.add_subplot(gs[idx // layout[1], idx % layout[1]])
-            self.axes.append(ax)
-            self._setup_plot(ax, config, idx)
+        with plt.rc_context(self._axes_style()):
+            for idx, config in enumerate(plot_configs):
+                ax = self.fig.add_subplot(gs[idx // layout[1], idx % layout[1]])
+                self.axes.append(ax)
+                self._setup_plot(ax, config, idx)
 
         # Create UI components
         self._create_ui_components()
 
+        # Plots now show the initial slider values at full resolution
+        self._last_signature = (self._data_signature(), self._drag_stride)
+
     def _create_ui_components(self):
         """Create all UI components (sliders, buttons, checkboxes)."""
+        # Coalesce slider drags with trailing debounces: plots are rebuilt
+        # (decimated) 30 ms after the last slider event and redrawn at full
+        # resolution once the slider rests for 200 ms. Events arriving faster
+        # than that keep postponing the rebuild
+        self._slider_update = DebouncedCallback(
+            self.fig.canvas, self._refresh_plots, interval=30
+        )
+        self._drag_settle = DebouncedCallback(
+            self.fig.canvas, self._on_drag_settle, interval=200
+        )
+        self._drag_slider: Optional[str] = None
+        # Releasing the mouse ends a drag without waiting for the settle timer
+        self.fig.canvas.mpl_connect("button_release_event", self._on_button_release)
+
         # Create sliders
-        self.slider_panel = SliderPanel(self.fig, self.slider_configs, self.colors)
+        self.slider_panel = SliderPanel(
+            self.fig, self.slider_configs, self.colors, self._blit_manager
+        )
         self.slider_panel.on_change(self._on_slider_change)
 
         # Create reset button
@@ -164,15 +271,73 @@ class GeneralizedVisualizer:
         self.button_panel.on_click(self._on_reset)
 
         # Create checkbox panel for plot visibility
-        self.checkbox_panel = CheckboxPanel(self.fig, self.plot_configs, self.colors)
+        self.checkbox_panel = CheckboxPanel(
+            self.fig,
+            self.plot_configs,
+            self.colors,
+            blit_manager=self._blit_manager,
+        )
         self.checkbox_panel.on_visibility_changed(self._on_checkbox_toggle)
 
     def _on_slider_change(self, slider_name: str, value: float):
         """Callback when any slider changes."""
+        # Events that resolve to the current value (e.g. a reset of a slider
+        # at its initial value) need no update
+        if self.slider_values.get(slider_name) == value:
+            return
         self.slider_values[slider_name] = value
+        if self._slider_update.deferred:
+            self._drag_stride = self.drag_decimation
+            self._drag_slider = slider_name
+            self._drag_settle(slider_name)
+        self._slider_update(slider_name)
+
+    def _on_button_release(self, event):
+        """Restore full resolution right away when a slider drag ends."""
+        if self._drag_settle.pending:
+            self._drag_settle.cancel()
+            self._on_drag_settle(self._drag_slider)
+
+    def _on_drag_settle(self, slider_name: str):
+        """Redraw at full resolution once the slider stopped moving."""
+        self._slider_update.cancel()
+        self._drag_stride = 1
+        self._refresh_plots(slider_name)
+
+    def _refresh_plots(self, slider_name: str):
+        """Update all plots for the current slider values and redraw them."""
+        # Slider positions that resolve to the data already shown need no
+        # update; the slider itself is redrawn by the slider panel
+        signature = (self._data_signature(), self._drag_stride)
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+
+        axes_state = self._axes_state()
         for idx, (ax, config) in enumerate(zip(self.axes, self.plot_configs)):
             self._update_plot(ax, config, idx)
-        self.fig.canvas.draw_idle()
+
+        if not self.slider_panel.uses_blit(slider_name):
+            self.fig.canvas.draw_idle()
+        elif self._axes_state() != axes_state:
+            # Limits or visibility changed, so the cached background is stale
+            self._blit_manager.invalidate()
+        else:
+            self._blit_manager.update()
+
+    def _data_signature(self) -> Any:
+        """
+        Return a hashable summary of the inputs of _get_plot_data.
+
+        Plots are only rebuilt when this changes. Subclasses whose data is
+        coarser than the slider values (e.g. nearest-key lookups) can
+        override it to skip updates that would show the same data.
+        """
+        return tuple(self.slider_values.items())
+
+    def _axes_state(self) -> List[Tuple[bool, Tuple[float, ...]]]:
+        """Snapshot visibility and view limits of all plot axes."""
+        return [(ax.get_visible(), tuple(ax.viewLim.bounds)) for ax in self.axes]
 
     def _on_reset(self):
         """Reset all sliders to initial values."""
@@ -181,10 +346,8 @@ class GeneralizedVisualizer:
     def _on_checkbox_toggle(self, label: str, visible: bool):
         """Toggle visibility of a data series across all plots."""
         # Update all lines with this label across all plots
-        for plot_idx, line_list in self.lines.items():
-            for line in line_list:
-                if hasattr(line, "get_label") and line.get_label() == label:
-                    line.set_visible(visible)
+        for line in self._label_lines().get(label, ()):
+            line.set_visible(visible)
 
         # Update legends to reflect visibility
         for ax in self.axes:
@@ -199,8 +362,50 @@ class GeneralizedVisualizer:
         if self.hide_empty_plots:
             self._update_plot_visibility()
 
+        # Plots skipped while hidden catch up on the current slider values
+        for plot_idx in sorted(self._stale_plots):
+            ax = self.axes[plot_idx]
+            if self._has_visible_lines(plot_idx):
+                self._stale_plots.discard(plot_idx)
+                self._update_plot(ax, self.plot_configs[plot_idx], plot_idx)
+
         self.fig.canvas.draw_idle()
 
+    def _axes_style(self) -> Dict[str, Any]:
+        """Return the rcParams that theme the plot axes."""
+        return {
+            "axes.facecolor": self.colors["axes_bg"],
+            "axes.edgecolor": self.colors["grid"],
+            "axes.labelcolor": self.colors["text"],
+            "axes.labelsize": 10,
+            "axes.titlecolor": self.colors["text"],
+            "axes.titlesize": 11,
+            "axes.titleweight": "bold",
+            "xtick.color": self.colors["text"],
+            "xtick.labelcolor": self.colors["text"],
+            "xtick.labelsize": 9,
+            "ytick.color": self.colors["text"],
+            "ytick.labelcolor": self.colors["text"],
+            "ytick.labelsize": 9,
+            "grid.color": self.colors["grid"],
+            "grid.alpha": 0.3,
+        }
+
+    def _label_lines(self) -> Dict[str, List[Any]]:
+        """
+        Return the plot artists of all plots grouped by label.
+
+        The index is rebuilt only after artists were removed or re-created
+        (see _clear_lines).
+        """
+        if self._lines_by_label is None:
+            self._lines_by_label = {}
+            for line_list in self.lines.values():
+                for line in line_list:
+                    entries = self._lines_by_label.setdefault(line.get_label(), [])
+                    entries.append(line)
+        return self._lines_by_label
+
     def _setup_plot(self, ax, config: PlotConfig, plot_idx: int):
         """
         Set up a single plot based on its configuration.
@@ -214,22 +419,18 @@ class GeneralizedVisualizer:
         plot_idx : int
           Index of this plot
         """
-        # Apply theme styling to axis
-        ax.set_facecolor(self.colors["axes_bg"])
-        ax.set_title(
-            config.title, fontweight="bold", color=self.colors["text"], fontsize=11
-        )
-        ax.set_xlabel(config.xlabel, color=self.colors["text"], fontsize=10)
-        ax.set_ylabel(config.ylabel, color=self.colors["text"], fontsize=10)
-        ax.tick_params(colors=self.colors["text"], labelsize=9)
-        for spine in ax.spines.values():
-            spine.set_color(self.colors["grid"])
+        # Colors and font sizes come from _axes_style, active during setup
+        ax.set_title(config.title)
+        ax.set_xlabel(config.xlabel)
+        ax.set_ylabel(config.ylabel)
 
         if config.grid:
-            ax.grid(True, alpha=0.3, color=self.colors["grid"])
+            ax.grid(True)
 
-        # Initialize empty lines that will be updated
+        # Initialize empty lines that will be updated; only matplotlib
+        # artists (Line2D, PathCollection) are stored here
         self.lines[plot_idx] = []
+        self._series_keys[plot_idx] = []
 
         # Initial plot (will be updated by _update_plot)
         self._update_plot(ax, config, plot_idx)
@@ -247,159 +448,211 @@ class GeneralizedVisualizer:
         plot_idx : int
           Index of this plot
         """
-        # Clear previous lines
-        for line in self.lines[plot_idx]:
-            line.remove()
-        self.lines[plot_idx] = []
+        # A plot whose series are all unchecked shows nothing new, whether or
+        # not its axis is hidden; it is skipped and refreshed once a series
+        # is shown again (see _on_checkbox_toggle)
+        if self.lines[plot_idx] and not self._has_visible_lines(plot_idx):
+            self._stale_plots.add(plot_idx)
+            return
 
         # Get data based on current slider values
         data = self._get_plot_data(config.data_key)
 
         # Handle empty data - hide plot if option enabled
         if data is None:
-            if self.hide_empty_plots:
+            self._clear_lines(plot_idx)
+            if self.hide_empty_plots and ax.get_visible():
                 ax.set_visible(False)
             return
 
-        # Handle different plot types
-        if config.plot_type == "line":
-            self._plot_lines(ax, data, config, plot_idx)
-        elif config.plot_type == "semilogy":
-            self._plot_semilogy(ax, data, config, plot_idx)
-        elif config.plot_type == "scatter":
-            self._plot_scatter(ax, data, config, plot_idx)
+        series = self._extract_series(data)
 
-        # Check if any lines were actually added
-        has_data = len(self.lines[plot_idx]) > 0
-        if self.hide_empty_plots:
+        # Retain existing artists and only swap their data when possible
+        if not self._update_lines(ax, series, config, plot_idx):
+            self._clear_lines(plot_idx)
+
+            # Handle different plot types
+            plot = self._plot_dispatch.get(config.plot_type)
+            if plot is not None:
+                plot(ax, series, config, plot_idx)
+
+            if self._blit_manager is not None:
+                for line in self.lines[plot_idx]:
+                    self._blit_manager.add_artist(line)
+
+        # Check if any visible lines are left
+        has_data = self._has_visible_lines(plot_idx)
+        if self.hide_empty_plots and ax.get_visible() != has_data:
             ax.set_visible(has_data)
 
-    def _plot_lines(self, ax, data, config: PlotConfig, plot_idx: int):
-        """Plot standard line plots."""
-        if isinstance(data, dict):
-            # Multiple lines
-            for idx, (key, values) in enumerate(data.items()):
-                # Handle both dict format and direct array format
-                if isinstance(values, dict):
-                    x_data = values.get("x", np.arange(len(values["y"])))
-                    y_data = values["y"]
-                else:
-                    # Direct array
-                    x_data = np.arange(len(values))
-                    y_data = values
-
-                color = (
-                    config.colors[idx]
-                    if config.colors and idx < len(config.colors)
-                    else None
-                )
-                linestyle = (
-                    config.linestyles[idx]
-                    if config.linestyles and idx < len(config.linestyles)
-                    else "-"
-                )
-                label = (
-                    config.labels[idx]
-                    if config.labels and idx < len(config.labels)
-                    else str(key)
-                )
-
-                (line,) = ax.plot(
-                    x_data, y_data, color=color, linestyle=linestyle, label=label, lw=2
-                )
-                self.lines[plot_idx].append(line)
-        else:
-            # Single line
-            if isinstance(data, dict):
-                x_data = data.get("x", np.arange(len(data["y"])))
-                y_data = data["y"]
+    def _has_visible_lines(self, plot_idx: int) -> bool:
+        """Whether any artist of a plot is currently shown."""
+        return any(line.get_visible() for line in self.lines[plot_idx])
+
+    def _clear_lines(self, plot_idx: int):
+        """Remove all artists of a plot."""
+        for line in self.lines[plot_idx]:
+            line.remove()
+            if self._blit_manager is not None:
+                self._blit_manager.remove_artist(line)
+        self.lines[plot_idx] = []
+        self._series_keys[plot_idx] = []
+        self._lines_by_label = None
+
+    def _update_lines(self, ax, series, config: PlotConfig, plot_idx: int) -> bool:
+        """
+        Update the retained lines of a plot in place.
+
+        Parameters:
+        -----------
+        ax : matplotlib axis
+          The axis holding the lines
+        series : list of (key, x, y)
+          Series to show, as returned by _extract_series
+        config : PlotConfig
+          Configuration for this plot
+        plot_idx : int
+          Index of this plot
+
+        Returns:
+        --------
+        bool
+          True if the lines were updated, False if they must be re-created
+        """
+        if config.plot_type not in ("line", "semilogy", "scatter"):
+            return False
+        lines = self.lines[plot_idx]
+        if not lines or self._series_keys[plot_idx] != [key for key, _, _ in series]:
+            return False
+
+        in_view = True
+        for line, (_, x_data, y_data) in zip(lines, series):
+            if config.plot_type == "scatter":
+                line.set_offsets(np.column_stack((x_data, y_data)))
             else:
-                x_data = np.arange(len(data))
-                y_data = data
+                if config.plot_type == "semilogy":
+                    # Ensure positive values for log scale
+                    y_data = _clip_log(y_data)
+                x_data, y_data = self._decimate(x_data, y_data)
+                line.set_data(x_data, y_data)
+            in_view = in_view and self._fits_view(ax, x_data, y_data)
+
+        # Only rescale when the new data leaves the current view
+        if not in_view:
+            if config.plot_type == "scatter":
+                # Axes.relim does not cover collections; rebuild the data
+                # limits from the scatter offsets instead
+                ax.ignore_existing_data_limits = True
+                for scatter in lines:
+                    ax.update_datalim(scatter.get_offsets())
+            else:
+                ax.relim()
+            ax.autoscale_view()
+        return True
+
+    @staticmethod
+    def _fits_view(ax, x_data, y_data) -> bool:
+        """Check if a series lies inside the current view limits of an axis."""
+        x_data = np.asarray(x_data)
+        y_data = np.asarray(y_data)
+        if x_data.size == 0 or y_data.size == 0:
+            return True
+        x0, x1 = sorted(ax.viewLim.intervalx)
+        y0, y1 = sorted(ax.viewLim.intervaly)
+        return bool(
+            x0 <= x_data.min()
+            and x_data.max() <= x1
+            and y0 <= y_data.min()
+            and y_data.max() <= y1
+        )
+
+    @staticmethod
+    def _extract_series(data) -> List[Tuple[Any, Any, Any]]:
+        """
+        Split plot data into (key, x, y) series.
 
+        A dict yields one series per entry, each either a dict with 'y' and an
+        optional 'x' or a direct array. Anything else is a single series with
+        key None.
+        """
+        if not isinstance(data, dict):
+            return [(None, _index_range(len(data)), data)]
+
+        series = []
+        for key, values in data.items():
+            # Handle both dict format and direct array format
+            if isinstance(values, dict):
+                y_data = values["y"]
+                x_data = values.get("x")
+                if x_data is None:
+                    x_data = _index_range(len(y_data))
+            else:
+                # Direct array
+                x_data = _index_range(len(values))
+                y_data = values
+            series.append((key, x_data, y_data))
+        return series
+
+    def _decimate(self, x_data, y_data):
+        """Thin out a series while a slider is being dragged."""
+        stride = self._drag_stride
+        if stride > 1 and len(y_data) >= 100 * stride:
+            return x_data[::stride], y_data[::stride]
+        return x_data, y_data
+
+    def _series_style(self, config: PlotConfig, idx: int, key) -> Tuple[Any, str, str]:
+        """Return (color, linestyle, label) for the idx-th series of a plot."""
+        if key is None:
+            # Single series
             label = config.labels[0] if config.labels else "Data"
+            return None, "-", label
+
+        color = (
+            config.colors[idx] if config.colors and idx < len(config.colors) else None
+        )
+        linestyle = (
+            config.linestyles[idx]
+            if config.linestyles and idx < len(config.linestyles)
+            else "-"
+        )
+        label = (
+            config.labels[idx]
+            if config.labels and idx < len(config.labels)
+            else str(key)
+        )
+        return color, linestyle, label
 
-            (line,) = ax.plot(x_data, y_data, label=label, lw=2)
+    def _plot_lines(self, ax, series, config: PlotConfig, plot_idx: int):
+        """Plot standard line plots."""
+        for idx, (key, x_data, y_data) in enumerate(series):
+            color, linestyle, label = self._series_style(config, idx, key)
+            x_data, y_data = self._decimate(x_data, y_data)
+            (line,) = ax.plot(
+                x_data, y_data, color=color, linestyle=linestyle, label=label, lw=2
+            )
             self.lines[plot_idx].append(line)
+            self._series_keys[plot_idx].append(key)
 
-    def _plot_semilogy(self, ax, data, config: PlotConfig, plot_idx: int):
+    def _plot_semilogy(self, ax, series, config: PlotConfig, plot_idx: int):
         """Plot with logarithmic y-axis."""
-        if isinstance(data, dict):
-            for idx, (key, values) in enumerate(data.items()):
-                # Handle both dict format and direct array format
-                if isinstance(values, dict):
-                    x_data = values.get("x", np.arange(len(values["y"])))
-                    y_data = values["y"]
-                else:
-                    # Direct array
-                    x_data = np.arange(len(values))
-                    y_data = values
-                color = (
-                    config.colors[idx]
-                    if config.colors and idx < len(config.colors)
-                    else None
-                )
-                linestyle = (
-                    config.linestyles[idx]
-                    if config.linestyles and idx < len(config.linestyles)
-                    else "-"
-                )
-                label = (
-                    config.labels[idx]
-                    if config.labels and idx < len(config.labels)
-                    else str(key)
-                )
-                # Ensure positive values for log scale
-                y_data = np.maximum(y_data, 1e-10)
-                (line,) = ax.semilogy(
-                    x_data, y_data, color=color, linestyle=linestyle, label=label, lw=2
-                )
-                self.lines[plot_idx].append(line)
-        else:
-            if isinstance(data, dict):
-                x_data = data.get("x", np.arange(len(data["y"])))
-                y_data = data["y"]
-            else:
-                x_data = np.arange(len(data))
-                y_data = data
-            label = config.labels[0] if config.labels else "Data"
+        for idx, (key, x_data, y_data) in enumerate(series):
+            color, linestyle, label = self._series_style(config, idx, key)
             # Ensure positive values for log scale
-            y_data = np.maximum(y_data, 1e-10)
-            (line,) = ax.semilogy(x_data, y_data, label=label, lw=2)
+            y_data = _clip_log(y_data)
+            x_data, y_data = self._decimate(x_data, y_data)
+            (line,) = ax.semilogy(
+                x_data, y_data, color=color, linestyle=linestyle, label=label, lw=2
+            )
             self.lines[plot_idx].append(line)
+            self._series_keys[plot_idx].append(key)
 
-    def _plot_scatter(self, ax, data, config: PlotConfig, plot_idx: int):
+    def _plot_scatter(self, ax, series, config: PlotConfig, plot_idx: int):
         """Plot scatter plots."""
-        if isinstance(data, dict):
-            for idx, (key, values) in enumerate(data.items()):
-                if isinstance(values, dict):
-                    x_data = values.get("x", np.arange(len(values["y"])))
-                    y_data = values["y"]
-                else:
-                    x_data = np.arange(len(values))
-                    y_data = values
-                color = (
-                    config.colors[idx]
-                    if config.colors and idx < len(config.colors)
-                    else None
-                )
-                label = (
-                    config.labels[idx]
-                    if config.labels and idx < len(config.labels)
-                    else str(key)
-                )
-                scatter = ax.scatter(x_data, y_data, color=color, label=label, s=20)
-                self.lines[plot_idx].append(scatter)
-        else:
-            if isinstance(data, dict):
-                x_data = data.get("x", np.arange(len(data["y"])))
-                y_data = data["y"]
-            else:
-                x_data = np.arange(len(data))
-                y_data = data
-            label = config.labels[0] if config.labels else "Data"
-            scatter = ax.scatter(x_data, y_data, label=label, s=20)
+        for idx, (key, x_data, y_data) in enumerate(series):
+            color, _, label = self._series_style(config, idx, key)
+            scatter = ax.scatter(x_data, y_data, color=color, label=label, s=20)
             self.lines[plot_idx].append(scatter)
+            self._series_keys[plot_idx].append(key)
 
     def _get_plot_data(self, data_key: str) -> Optional[Any]:
         """
@@ -418,41 +671,78 @@ class GeneralizedVisualizer:
         # For now, it supports basic key lookup and slider-dependent data
 
         if "." in data_key:
-            # Support nested keys like 'neuron_data.predictions'
-            keys = data_key.split(".")
-            data = self.data_dict
-            for key in keys:
-                if isinstance(data, dict) and key in data:
-                    data = data[key]
-                else:
-                    return None
-
-            # If data is slider-dependent (dict with numeric keys)
-            if isinstance(data, dict) and all(
-                isinstance(k, (int, float)) for k in data.keys()
-            ):
-                # Get data for current slider value
-                slider_val = list(self.slider_values.values())[0]  # Use first slider
-                if slider_val in data:
-                    return data[slider_val]
-                else:
-                    # Find nearest key
-                    nearest = min(data.keys(), key=lambda x: abs(x - slider_val))
-                    return data[nearest]
-            return data
+            slider_val = next(iter(self.slider_values.values()), None)  # First slider
+            return self._lookup_nested(data_key, slider_val)
         else:
             # Simple key lookup
             return self.data_dict.get(data_key)
 
+    def _lookup_nested(self, data_key: str, slider_val: Optional[float]):
+        """Resolve a dotted data_key, picking the nearest slider-keyed entry."""
+        # Support nested keys like 'neuron_data.predictions'
+        keys = data_key.split(".")
+        data = self.data_dict
+        for key in keys:
+            if isinstance(data, dict) and key in data:
+                data = data[key]
+            else:
+                return None
+
+        # If data is slider-dependent (dict with numeric keys)
+        if (
+            slider_val is not None
+            and isinstance(data, dict)
+            and all(isinstance(k, (int, float)) for k in data.keys())
+        ):
+            # Get data for current slider value
+            if slider_val in data:
+                return data[slider_val]
+            return data[self._nearest_key(data_key, data, slider_val)]
+        return data
+
+    def _nearest_key(self, data_key: str, data: Dict, slider_val: float):
+        """
+        Return the numeric key of data closest to slider_val.
+
+        The sorted keys of each slider-dependent dict are indexed, so a
+        lookup is a binary search instead of a scan over all keys. The index
+        is checked against the current key set and rebuilt whenever keys
+        were added, removed or replaced. Equally distant keys resolve to the
+        one inserted first, like min() over data.keys().
+        """
+        entry = self._key_index.get(data_key)
+        if entry is None or data.keys() != entry[0]:
+            position = {key: pos for pos, key in enumerate(data)}
+            keys = sorted(position)
+            entry = (
+                frozenset(position),
+                keys,
+                np.asarray(keys, dtype=float),
+                [position[key] for key in keys],
+            )
+            self._key_index[data_key] = entry
+        _, keys, key_array, positions = entry
+
+        i = int(np.searchsorted(key_array, slider_val))
+        if i == 0:
+            return keys[0]
+        if i == len(keys):
+            return keys[-1]
+        above = key_array[i] - slider_val
+        below = slider_val - key_array[i - 1]
+        if above < below or (above == below and positions[i] < positions[i - 1]):
+            return keys[i]
+        return keys[i - 1]
+
     def _update_plot_visibility(self):
         """Hide plots that have no visible lines, show plots that have visible lines."""
         for plot_idx, ax in enumerate(self.axes):
             line_list = self.lines.get(plot_idx, [])
             # Check if any line in this plot is visible
-            has_visible_lines = any(
-                line.get_visible() for line in line_list if hasattr(line, "get_visible")
-            )
-            ax.set_visible(has_visible_lines)
+            has_visible_lines = any(line.get_visible() for line in line_list)
+            # Setting an unchanged value would still mark the axis stale
+            if ax.get_visible() != has_visible_lines:
+                ax.set_visible(has_visible_lines)
 
     def show(self):
         """Display the interactive visualization."""